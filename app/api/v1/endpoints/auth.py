@@ -1,7 +1,61 @@
-from fastapi import APIRouter
+from typing import Any, Dict, Optional
 
-router = APIRouter()
+from fastapi import APIRouter, Depends, HTTPException, status
 
-@router.get("/auth")
-async def login_check():
-    return {"message": "Auth route works!"}
\ No newline at end of file
+from app.dependencies.auth import ADMIN_ROLE, require_admin
+from app.dependencies.rate_limit import login_guard
+from app.schemas.auth import LoginRequest, LogoutRequest, RefreshRequest
+from app.services import auth_service
+from app.services.credential_service import CredentialServiceBusy
+from app.services.user_service import InvalidPassword, authenticate_user
+
+router = APIRouter(prefix="/api/v1/auth", tags=["auth"])
+
+
+@router.post("/login", dependencies=[Depends(login_guard)])
+async def login(data: LoginRequest):
+    """
+    Exchange admin credentials for a short-lived access token and a refresh token.
+    """
+    try:
+        user = await authenticate_user(data.email, data.password)
+    except InvalidPassword:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    except CredentialServiceBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, please retry",
+            headers={"Retry-After": "1"},
+        )
+    if user is not None:
+        if user.role != ADMIN_ROLE:
+            # Only the admin dashboard uses these tokens; other accounts get none
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+        return await auth_service.issue_tokens(subject=user.email, role=user.role)
+    # The bootstrap pair only stands in for an admin that has no users entry yet
+    if auth_service.check_admin_credentials(data.email, data.password):
+        return await auth_service.issue_tokens(subject=data.email.strip().lower())
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+
+@router.post("/refresh")
+async def refresh(data: RefreshRequest):
+    """
+    Rotate a refresh token: returns a new token pair and invalidates the old refresh token.
+    """
+    tokens = await auth_service.rotate_refresh_token(data.refresh_token)
+    if tokens is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    return tokens
+
+
+@router.post("/logout")
+async def logout(
+    data: Optional[LogoutRequest] = None,
+    claims: Dict[str, Any] = Depends(require_admin),
+):
+    """
+    Revoke the current access token (and the refresh token, if given).
+    """
+    await auth_service.revoke(claims, data.refresh_token if data else None)
+    return {"message": "Logged out"}
@@ -1,56 +1,249 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
 
-from app.schemas.contact import ContactCreate, ContactInDB
-from app.services.contact_service import save_contact
-from app.dependencies.email_provider import email_sender  # ✅ Use this
+from app.schemas.contact import ContactCreate, ContactInDB, ContactUpdate
+from app.services.contact_service import (
+    save_contact, forget_fingerprint, get_contact, invalidate_contact, refresh_fingerprint,
+)
+from app.services.archive_service import ARCHIVE_COLLECTION
+from app.services.count_service import total_count
+from app.services.email_validation_service import normalize_email
+from app.services.lead_service import refresh_leads
+from app.services.notification_service import (
+    NotificationService, get_notification_service, SENT, QUEUED,
+)
+from app.dependencies.idempotency import idempotent_request, replay_response
+from app.dependencies.rate_limit import contact_write_guard
+from app.dependencies.auth import require_admin
 from app.database.mongodb import get_db
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_after
 
 router = APIRouter(prefix="/api/v1", tags=["contact"])
 
+_IDEMPOTENCY_SCOPE = "POST /api/v1/contact"
+
+MAX_PAGE_SIZE = 1000
+# Matches the trailing keys of the contacts indexes created in ensure_indexes
+_LIST_SORT = [("created_at", -1), ("_id", -1)]
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _and(clauses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {"$and": clauses} if len(clauses) > 1 else (clauses[0] if clauses else {})
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """created_at is stored as naive UTC; bring aware query params in line."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _contact_out(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a contacts document for the API, defaulting fields legacy rows lack."""
+    return {
+        "id": str(doc["_id"]),
+        "first_name": doc.get("first_name", ""),
+        "last_name": doc.get("last_name", ""),
+        "email": doc.get("email", ""),
+        "phone_number": doc.get("phone_number", ""),
+        "message": doc.get("message", ""),
+        "services": doc.get("services", []),
+        "created_at": doc.get("created_at"),
+        "updated_at": doc.get("updated_at"),
+        "version": doc.get("version", 0),
+        "archived": "archived_at" in doc,
+        "spam": doc.get("spam", False),
+    }
+
+
+def _applied(before: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+    """The document after ``{"$set": changes, "$inc": {"version": 1}}`` was applied to ``before``."""
+    return {**before, **changes, "version": before.get("version", 0) + 1}
+
+
+def _etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, so W/"3" matches "3")."""
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
+def _parse_if_match(value: Optional[str]) -> Optional[int]:
+    """If-Match -> expected version (None when absent or "*")."""
+    if value is None:
+        return None
+    value = value.strip()
+    if value == "*":
+        return None
+    if value.startswith("W/"):
+        value = value[2:]
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="If-Match must be an ETag from this API")
+
 
 @router.post("/contact", status_code=status.HTTP_201_CREATED)
-async def create_contact(data: ContactCreate):
+async def create_contact(
+    data: ContactCreate,
+    request: Request,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    notifications: NotificationService = Depends(get_notification_service),
+):
     """
     • Save to MongoDB
     • Send notification email
+    • Duplicate re-submissions return the original id and send nothing
+    • Retries carrying the same Idempotency-Key replay the first response
     """
-    inserted_id = await save_contact(data)
-    try:
-        await email_sender.send_contact_email(data.dict())  # ✅ Fixed usage
-        return {"id": inserted_id, "message": "Contact saved & mail sent"}
-    except Exception as exc:
-        # Log the error but don't fail the request since data is saved
-        print(f"Email sending failed: {exc}")
-        return {"id": inserted_id, "message": "Contact saved (email notification failed)"}
+    async with idempotent_request(
+        _IDEMPOTENCY_SCOPE, idempotency_key, data.dict(), guard=contact_write_guard(request)
+    ) as call:
+        if call.replay is not None:
+            return replay_response(call.replay)
+        body = await _submit(data, response, notifications)
+        call.complete(response.status_code or status.HTTP_201_CREATED, body)
+    return body
+
+
+async def _submit(data: ContactCreate, response: Response,
+                  notifications: NotificationService) -> Dict[str, Any]:
+    saved = await save_contact(data)
+    inserted_id = saved.id
+    if saved.duplicate:
+        response.status_code = status.HTTP_200_OK
+        body = {"id": inserted_id, "message": "Duplicate submission ignored"}
+    elif saved.spam:
+        # Same shape as a normal save so the sender learns nothing from it
+        body = {"id": inserted_id, "message": "Contact saved"}
+    else:
+        outcome = await notifications.notify_contact(data.dict())
+        if outcome == SENT:
+            body = {"id": inserted_id, "message": "Contact saved & mail sent"}
+        elif outcome == QUEUED:
+            # Data is saved; the mail is queued and retried once SMTP recovers
+            body = {"id": inserted_id, "message": "Contact saved (email notification queued)"}
+        else:
+            body = {"id": inserted_id, "message": "Contact saved (email notifications disabled)"}
+    return body
 
 
-@router.get("/contact", response_model=list[ContactInDB])
-async def list_contacts(db=Depends(get_db)):
+@router.get(
+    "/contact",
+    response_model=list[ContactInDB],
+    dependencies=[Depends(require_admin)],
+)
+async def list_contacts(
+    response: Response,
+    services: Optional[List[str]] = Query(None, description="Contacts asking for any of these services"),
+    created_from: Optional[datetime] = Query(None, description="Created at or after (UTC)"),
+    created_to: Optional[datetime] = Query(None, description="Created before (UTC)"),
+    email: Optional[str] = Query(None, description="Exact address, matched case-insensitively"),
+    include_archived: bool = Query(False, description="Also list contacts moved to the archive"),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    db=Depends(get_db),
+):
     """
-    Return all contacts (newest first) for the admin dashboard.
+    Return contacts (newest first) for the admin dashboard.
+
+    Every filter combination is served by one of the compound indexes in
+    ensure_indexes, sorted the same way, so pages are index-bounded scans.
+    Pass the ``X-Next-Cursor`` header of one page as ``cursor`` to get the next.
     """
-    docs = await db["contacts"].find().sort("_id", -1).to_list(1000)
-    normalized_docs = []
-    
-    for doc in docs:
-        # Normalize the document keys
-        normalized_doc = {
-            "id": str(doc.pop("_id")),
-            "first_name": doc.get("first_name", ""),
-            "last_name": doc.get("last_name", ""),
-            "email": doc.get("email", ""),
-            "phone_number": doc.get("phone_number", ""),
-            "message": doc.get("message", ""),
-            "services": doc.get("services", []),
-            "created_at": doc.get("created_at")
-        }
-        normalized_docs.append(normalized_doc)
-    
-    return normalized_docs
+    clauses: List[Dict[str, Any]] = []
+    if services:
+        clauses.append({"services": services[0] if len(services) == 1 else {"$in": services}})
+    if email:
+        try:
+            clauses.append({"email_normalized": normalize_email(email)})
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid email filter")
+    created_at: Dict[str, Any] = {}
+    if created_from:
+        created_at["$gte"] = _naive_utc(created_from)
+    if created_to:
+        created_at["$lt"] = _naive_utc(created_to)
+    if created_at:
+        clauses.append({"created_at": created_at})
+    # The total covers the whole filtered view, not what is left after the cursor
+    count_query = _and(clauses)
+    if cursor:
+        try:
+            after_ts, after_id = decode_cursor(cursor)
+            clauses.append(keyset_after("created_at", after_ts, ObjectId(after_id)))
+        except (ValueError, InvalidId):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    query = _and(clauses)
+    collections = ["contacts", ARCHIVE_COLLECTION] if include_archived else ["contacts"]
+    results = await asyncio.gather(
+        *(db[name].find(query).sort(_LIST_SORT).limit(limit).to_list(limit) for name in collections),
+        *(total_count(name, count_query) for name in collections),
+    )
+    pages, totals = results[:len(collections)], results[len(collections):]
+    if include_archived:
+        # Both sides are sorted the same way, so the newest ``limit`` of the union
+        # is a merge of the two pages and the keyset cursor stays valid across them
+        docs = heapq.merge(*pages, key=lambda doc: (doc.get("created_at") or _EPOCH, doc["_id"]), reverse=True)
+        docs = list(itertools.islice(docs, limit))
+    else:
+        docs = pages[0]
+    total = None if None in totals else sum(totals)
+    if len(docs) == limit and docs[-1].get("created_at"):
+        response.headers["X-Next-Cursor"] = encode_cursor(docs[-1]["created_at"], docs[-1]["_id"])
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+    return [_contact_out(doc) for doc in docs]
+
+
+@router.get(
+    "/contact/{contact_id}",
+    response_model=ContactInDB,
+    dependencies=[Depends(require_admin)],
+)
+async def read_contact(
+    contact_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+):
+    """
+    Get a single contact by ID. The ETag is the contact version, so a client
+    revalidating with If-None-Match gets a 304 while nothing has changed.
+    """
+    try:
+        object_id = ObjectId(contact_id)
+    except InvalidId:
+        raise HTTPException(status_code=404, detail="Contact not found")
 
+    doc = await get_contact(object_id)
+    if doc is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
 
-@router.put("/contact/{contact_id}")
+    etag = _etag(doc.get("version", 0))
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return _contact_out(doc)
+
+
+@router.put("/contact/{contact_id}", dependencies=[Depends(require_admin)])
 async def update_contact(contact_id: str, data: ContactCreate, db=Depends(get_db)):
     """
     Update a contact by ID.
@@ -58,32 +251,99 @@ async def update_contact(contact_id: str, data: ContactCreate, db=Depends(get_db
     try:
         # Validate ObjectId
         object_id = ObjectId(contact_id)
-        
-        # Update the contact
-        result = await db["contacts"].update_one(
-            {"_id": object_id},
-            {
-                "$set": {
-                    "first_name": data.first_name,
-                    "last_name": data.last_name,
-                    "email": data.email,
-                    "phone_number": data.phone_number,
-                    "message": data.message,
-                    "services": data.services,
-                }
-            }
-        )
-        
-        if result.matched_count == 0:
-            raise HTTPException(status_code=404, detail="Contact not found")
-        
-        return {"message": "Contact updated successfully"}
-        
-    except Exception as e:
+    except InvalidId as e:
         raise HTTPException(status_code=400, detail=f"Invalid contact ID: {str(e)}")
+    
+    # Update the contact
+    fields = {
+        "first_name": data.first_name,
+        "last_name": data.last_name,
+        "email": data.email,
+        "email_normalized": normalize_email(data.email),
+        "phone_number": data.phone_number,
+        "message": data.message,
+        "services": data.services,
+        "updated_at": datetime.utcnow(),
+    }
+    before = await db["contacts"].find_one_and_update(
+        {"_id": object_id},
+        {"$set": fields, "$inc": {"version": 1}},
+        return_document=ReturnDocument.BEFORE,
+    )
+    
+    invalidate_contact(contact_id)
+    
+    if before is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    
+    doc = _applied(before, fields)
+    # The duplicate check must see the new content, not the submitted one
+    await refresh_fingerprint(doc)
+    await refresh_leads([before.get("email_normalized"), doc["email_normalized"]])
+    
+    return {"message": "Contact updated successfully"}
 
 
-@router.delete("/contact/{contact_id}")
+@router.patch(
+    "/contact/{contact_id}",
+    response_model=ContactInDB,
+    dependencies=[Depends(require_admin)],
+)
+async def patch_contact(
+    contact_id: str,
+    data: ContactUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
+    db=Depends(get_db),
+):
+    """
+    Update only the fields sent. With ``If-Match: "<version>"`` the write only
+    happens if nobody changed the contact since that version (412 otherwise);
+    the check and the write are a single atomic find_one_and_update.
+    """
+    try:
+        object_id = ObjectId(contact_id)
+    except InvalidId as e:
+        raise HTTPException(status_code=400, detail=f"Invalid contact ID: {str(e)}")
+
+    changes = data.changes()
+    if not changes:
+        raise HTTPException(status_code=400, detail="No fields to update")
+    if "email" in changes:
+        changes["email_normalized"] = normalize_email(changes["email"])
+    changes["updated_at"] = datetime.utcnow()
+
+    query: Dict[str, Any] = {"_id": object_id}
+    expected_version = _parse_if_match(if_match)
+    if expected_version is not None:
+        # Documents written before versioning have no field; they count as version 0
+        query["version"] = expected_version if expected_version else {"$in": [0, None]}
+
+    before = await db["contacts"].find_one_and_update(
+        query,
+        {"$set": changes, "$inc": {"version": 1}},
+        return_document=ReturnDocument.BEFORE,
+    )
+    invalidate_contact(contact_id)
+    if before is None:
+        if expected_version is not None and await db["contacts"].count_documents(
+            {"_id": object_id}, limit=1
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Contact was modified by someone else; reload and retry",
+            )
+        raise HTTPException(status_code=404, detail="Contact not found")
+
+    doc = _applied(before, changes)
+    if changes.keys() & {"email", "phone_number", "message"}:
+        await refresh_fingerprint(doc)
+    await refresh_leads([before.get("email_normalized"), doc.get("email_normalized")])
+    response.headers["ETag"] = _etag(doc.get("version", 0))
+    return _contact_out(doc)
+
+
+@router.delete("/contact/{contact_id}", dependencies=[Depends(require_admin)])
 async def delete_contact(contact_id: str, db=Depends(get_db)):
     """
     Delete a contact by ID.
@@ -91,14 +351,21 @@ async def delete_contact(contact_id: str, db=Depends(get_db)):
     try:
         # Validate ObjectId
         object_id = ObjectId(contact_id)
-        
-        # Delete the contact
-        result = await db["contacts"].delete_one({"_id": object_id})
-        
-        if result.deleted_count == 0:
-            raise HTTPException(status_code=404, detail="Contact not found")
-        
-        return {"message": "Contact deleted successfully"}
-        
-    except Exception as e:
+    except InvalidId as e:
         raise HTTPException(status_code=400, detail=f"Invalid contact ID: {str(e)}")
+    
+    # Delete the contact
+    deleted = await db["contacts"].find_one_and_delete(
+        {"_id": object_id}, projection={"fingerprint": 1, "email_normalized": 1}
+    )
+    
+    invalidate_contact(contact_id)
+    
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    
+    if deleted.get("fingerprint"):
+        forget_fingerprint(deleted["fingerprint"])
+    await refresh_leads([deleted.get("email_normalized")])
+    
+    return {"message": "Contact deleted successfully"}
@@ -0,0 +1,53 @@
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+
+from app.dependencies.auth import require_admin
+from app.schemas.lead import LeadInDB
+from app.services.count_service import total_count
+from app.services.lead_service import list_leads
+from app.utils.pagination import decode_cursor, encode_cursor
+
+router = APIRouter(
+    prefix="/api/v1/leads", tags=["leads"], dependencies=[Depends(require_admin)]
+)
+
+MAX_PAGE_SIZE = 1000
+
+
+def _lead_out(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "email": doc.get("email", doc["_id"]),
+        "first_name": doc.get("first_name", ""),
+        "last_name": doc.get("last_name", ""),
+        "phone_number": doc.get("phone_number", ""),
+        "latest_message": doc.get("latest_message", ""),
+        "latest_contact_id": doc.get("latest_contact_id", ""),
+        "submission_count": doc.get("submission_count", 0),
+        "services": doc.get("services", []),
+        "first_seen": doc.get("first_seen"),
+        "last_seen": doc.get("last_seen"),
+    }
+
+
+@router.get("", response_model=list[LeadInDB])
+async def get_leads(
+    response: Response,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+):
+    """
+    Contacts grouped by normalized email, most recently active first.
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    docs = await list_leads(limit, after)
+    if len(docs) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(docs[-1]["last_seen"], docs[-1]["_id"])
+    response.headers["X-Total-Count"] = str(await total_count("leads", {}))
+    return [_lead_out(doc) for doc in docs]
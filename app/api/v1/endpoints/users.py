@@ -1,10 +1,87 @@
-from fastapi import APIRouter, Depends
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
 from app.database.mongodb import get_db
+from app.dependencies.auth import require_admin
+from app.services.count_service import total_count
+from app.utils.json_encoding import FastJSONResponse, dumps
+
+router = APIRouter(
+    prefix="/api/v1/users", tags=["users"], dependencies=[Depends(require_admin)]
+)
+
+PAGE_SIZE = 100
+MAX_LIMIT = 10000
+
+# Never send credentials to the client
+_USER_PROJECTION = {"hashed_password": 0}
+
+
+def _public_user(doc: Dict[str, Any]) -> Dict[str, Any]:
+    doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+async def _stream_users(cursor) -> AsyncIterator[bytes]:
+    """Write a JSON array one batch at a time instead of buffering the whole list."""
+    yield b"["
+    batch: List[bytes] = []
+    first = True
+    async for doc in cursor:
+        batch.append(dumps(_public_user(doc)))
+        if len(batch) == PAGE_SIZE:
+            yield (b"" if first else b",") + b",".join(batch)
+            batch.clear()
+            first = False
+    if batch:
+        yield (b"" if first else b",") + b",".join(batch)
+    yield b"]"
+
+
+@router.get("")
+async def get_users(
+    limit: int = Query(50, ge=1, le=MAX_LIMIT),
+    after: Optional[str] = Query(None, description="id of the last user on the previous page"),
+    db=Depends(get_db),
+):
+    """
+    List users in id order using keyset pagination.
+
+    Pass the ``X-Next-Cursor`` header of one page as ``after`` to get the next.
+    Requests for more than one page are streamed and carry the cursor too.
+    """
+    query: Dict[str, Any] = {}
+    if after:
+        try:
+            query["_id"] = {"$gt": ObjectId(after)}
+        except InvalidId:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
-router = APIRouter()
+    headers = {"X-Total-Count": str(await total_count("users", {}))}
 
+    if limit > PAGE_SIZE:
+        # Headers go out before the body, so find the page's last id first
+        # (index-only) and cap the stream there; the cursor then matches the body
+        last = await (
+            db["users"].find(query, {"_id": 1}).sort("_id", 1).skip(limit - 1).limit(1)
+        ).to_list(1)
+        if last:
+            headers["X-Next-Cursor"] = str(last[0]["_id"])
+            query = {"_id": {**query.get("_id", {}), "$lte": last[0]["_id"]}}
+        cursor = (
+            db["users"].find(query, _USER_PROJECTION).sort("_id", 1)
+            .limit(limit).batch_size(PAGE_SIZE)
+        )
+        return StreamingResponse(
+            _stream_users(cursor), media_type="application/json", headers=headers
+        )
 
-@router.get("/")
-async def get_users(db=Depends(get_db)):
-    users = await db["users"].find().to_list(100)
-    return users
+    cursor = db["users"].find(query, _USER_PROJECTION).sort("_id", 1).limit(limit)
+    users = [_public_user(doc) for doc in await cursor.to_list(limit)]
+    if len(users) == limit:
+        headers["X-Next-Cursor"] = users[-1]["id"]
+    return FastJSONResponse(users, headers=headers)
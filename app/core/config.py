@@ -1,21 +1,159 @@
 import os
+from functools import lru_cache
+from typing import Optional
+
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+
+def _env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Read a setting from the environment. Keys are case-insensitive: the
+    upper-case form (SMTP_HOST) wins, the lower-case form (smtp_host) used by
+    older .env files is accepted as a fallback.
+    """
+    value = os.environ.get(name.upper())
+    if value is None:
+        value = os.environ.get(name.lower())
+    return default if value is None else value
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return _env(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_positive(name: str, default: str) -> float:
+    """A float setting that must be > 0 (rate limiters divide by it)."""
+    value = float(_env(name, default))
+    if value <= 0:
+        raise ValueError(f"{name.upper()} must be greater than 0, got {value}")
+    return value
+
 
 class Settings:
+    """All configuration, read from the environment (and .env) exactly once."""
+
     def __init__(self):
-        self.mongo_uri = os.getenv("mongo_uri", "mongodb://localhost:27017")
-        self.mongo_db_name = os.getenv("MONGO_DB_NAME", "my_fastapi_db")
+        self.app_env = _env("app_env", "development").lower()
+
+        self.mongo_uri = _env("mongo_uri", "mongodb://localhost:27017")
+        self.mongo_db_name = _env("mongo_db_name", "contact_db")
         
         # Email settings
-        self.smtp_host = os.getenv("smtp_host", "smtp.gmail.com")
-        self.smtp_port = os.getenv("smtp_port", "587")
-        self.smtp_username = os.getenv("smtp_username", "")
-        self.smtp_password = os.getenv("smtp_password", "")
-        self.smtp_use_tls = os.getenv("smtp_use_tls", "true")
-        self.notify_email = os.getenv("notify_email", "")
-        self.default_from_email = os.getenv("default_from_email", "")
-
-settings = Settings()
+        self.smtp_host = _env("smtp_host", "smtp.gmail.com")
+        self.smtp_port = int(_env("smtp_port", "587"))
+        self.smtp_username = _env("smtp_username", "")
+        self.smtp_password = _env("smtp_password", "")
+        self.smtp_use_tls = _env_bool("smtp_use_tls", "true")
+        self.notify_email = _env("notify_email", "")
+        self.default_from_email = _env("default_from_email", "")
+        # Seconds; a hung SMTP host must fail fast instead of stalling requests
+        self.smtp_connect_timeout = float(_env("smtp_connect_timeout", "5"))
+        self.smtp_send_timeout = float(_env("smtp_send_timeout", "10"))
+        # Max wait for the shared SMTP session before a mail is queued instead
+        self.smtp_lock_timeout = float(_env("smtp_lock_timeout", "1"))
+
+        # Validation
+        self.email_validation_cache_size = int(_env("email_validation_cache_size", "4096"))
+
+        # Duplicate submission detection
+        self.duplicate_window_seconds = int(_env("duplicate_window_seconds", "600"))
+        self.duplicate_cache_size = int(_env("duplicate_cache_size", "2048"))
+
+        # Single-contact read cache (per worker, so the TTL bounds cross-worker staleness)
+        self.contact_cache_size = int(_env("contact_cache_size", "1024"))
+        self.contact_cache_ttl_seconds = float(_env("contact_cache_ttl_seconds", "30"))
+
+        # X-Total-Count for filtered lists: short-lived exact counts, computed in the background
+        self.count_cache_size = int(_env("count_cache_size", "512"))
+        self.count_cache_ttl_seconds = float(_env("count_cache_ttl_seconds", "10"))
+        self.count_wait_budget_ms = float(_env("count_wait_budget_ms", "50"))
+
+        # Cold-contact archival (ARCHIVE_AFTER_DAYS=0 turns it off)
+        self.archive_after_days = int(_env("archive_after_days", "0"))
+        self.archive_interval_seconds = float(_env("archive_interval_seconds", "3600"))
+        self.archive_batch_size = int(_env("archive_batch_size", "500"))
+        self.archive_batch_pause_seconds = float(_env("archive_batch_pause_seconds", "1"))
+
+        # Spam scoring (scores are 0..1; at or above the threshold a contact is stored flagged, no mail)
+        self.spam_enabled = _env_bool("spam_enabled", "true")
+        self.spam_threshold = float(_env("spam_threshold", "0.7"))
+        self.spam_workers = int(_env("spam_workers", "1"))
+        self.spam_timeout_ms = float(_env("spam_timeout_ms", "250"))
+        self.spam_model_path = _env("spam_model_path", "")
+        self.spam_disposable_domains = frozenset(
+            d.strip().lower() for d in _env("spam_disposable_domains", "").split(",") if d.strip()
+        )
+
+        # /readyz dependency probes, refreshed in the background
+        self.health_probe_interval = float(_env("health_probe_interval", "5"))
+        self.health_probe_timeout = float(_env("health_probe_timeout", "2"))
+
+        # Idempotency-Key replay storage
+        self.idempotency_ttl_seconds = int(_env("idempotency_ttl_seconds", "86400"))
+        self.idempotency_cache_size = int(_env("idempotency_cache_size", "4096"))
+        # A request still "in progress" after this long is assumed dead and may be retried
+        self.idempotency_pending_timeout = float(_env("idempotency_pending_timeout", "60"))
+
+        # Public form rate limiting / admission control (rates are tokens per second)
+        self.contact_rate_per_ip = _env_positive("contact_rate_per_ip", "0.2")
+        self.contact_burst_per_ip = _env_positive("contact_burst_per_ip", "10")
+        self.contact_rate_global = _env_positive("contact_rate_global", "50")
+        self.contact_burst_global = _env_positive("contact_burst_global", "100")
+        self.contact_max_in_flight = int(_env("contact_max_in_flight", "64"))
+        self.trust_forwarded_for = _env_bool("trust_forwarded_for", "false")
+
+        # SMTP circuit breaker and the Mongo outbox mail falls back to
+        self.smtp_breaker_failure_threshold = int(_env("smtp_breaker_failure_threshold", "3"))
+        self.smtp_breaker_reset_timeout = float(_env("smtp_breaker_reset_timeout", "30"))
+        # Seconds between outbox polls; picks up mail queued by other workers or before a restart
+        self.notification_poll_interval = float(_env("notification_poll_interval", "5"))
+        self.notification_rules_refresh_interval = float(_env("notification_rules_refresh_interval", "30"))
+
+        # Admin authentication (JWT_PREVIOUS_SECRET keeps old tokens valid during rotation)
+        self.jwt_secret = _env("jwt_secret", "")
+        self.jwt_previous_secret = _env("jwt_previous_secret", "")
+        self.access_token_ttl_seconds = int(_env("access_token_ttl_seconds", "900"))
+        self.refresh_token_ttl_seconds = int(_env("refresh_token_ttl_seconds", str(14 * 24 * 3600)))
+        self.auth_token_cache_size = int(_env("auth_token_cache_size", "4096"))
+        self.revocation_refresh_interval = float(_env("revocation_refresh_interval", "30"))
+        # Login attempts per client IP (tokens per second / burst)
+        self.login_rate_per_ip = _env_positive("login_rate_per_ip", "0.2")
+        self.login_burst_per_ip = _env_positive("login_burst_per_ip", "10")
+        # Bootstrap admin, used only when no matching user exists in the users collection
+        self.admin_email = _env("admin_email", "")
+        self.admin_password = _env("admin_password", "")
+
+        # Password hashing (bcrypt). Raising the rounds rehashes users at their next login
+        self.bcrypt_rounds = int(_env("bcrypt_rounds", "12"))
+        self.password_hash_workers = int(_env("password_hash_workers", "2"))
+        self.password_hash_max_pending = int(_env("password_hash_max_pending", "32"))
+
+        # Server (run.py). web_concurrency=0 means one worker per CPU in production mode
+        self.server_host = _env("server_host", "0.0.0.0")
+        self.server_port = int(_env("server_port", "8000"))
+        self.web_concurrency = int(_env("web_concurrency", "0"))
+        self.server_backlog = int(_env("server_backlog", "2048"))
+        self.server_keep_alive = int(_env("server_keep_alive", "15"))
+        self.server_graceful_timeout = int(_env("server_graceful_timeout", "30"))
+        self.server_max_requests = int(_env("server_max_requests", "50000"))
+        self.server_max_requests_jitter = int(_env("server_max_requests_jitter", "5000"))
+
+        # Response compression (br/zstd used only when brotli/zstandard are installed)
+        self.compression_minimum_size = int(_env("compression_minimum_size", "1024"))
+        self.compression_gzip_level = int(_env("compression_gzip_level", "6"))
+        self.compression_brotli_quality = int(_env("compression_brotli_quality", "4"))
+        self.compression_zstd_level = int(_env("compression_zstd_level", "3"))
+        self.compression_compress_streams = _env_bool("compression_compress_streams", "true")
+
+        # Graceful shutdown: total seconds allowed for draining before pools are closed
+        self.shutdown_drain_timeout = float(_env("shutdown_drain_timeout", "20"))
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env once and build the shared Settings instance."""
+    load_dotenv()
+    return Settings()
+
+
+settings = get_settings()
@@ -0,0 +1,136 @@
+# app/core/lifecycle.py
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+DrainStep = Callable[[float], Awaitable[None]]
+CloseStep = Callable[[], Awaitable[None]]
+
+
+class LifecycleManager:
+    """
+    Owns background work for the lifetime of the app and shuts it down in order:
+
+    1. stop accepting new writes (``accepting`` flips to False) and cancel
+       periodic jobs
+    2. wait for tracked background tasks
+    3. run drain steps (queues, buffers), each given the time left
+    4. run close steps (SMTP, Mongo, ...) in registration order
+
+    Steps 2-3 share one deadline so a stuck dependency can't hang a deploy.
+    """
+
+    def __init__(self, drain_timeout: float = 20.0):
+        self.drain_timeout = drain_timeout
+        self.accepting = True
+        self._tasks: Set[asyncio.Task] = set()
+        self._periodic: Set[asyncio.Task] = set()
+        self._drain_steps: List[Tuple[str, DrainStep]] = []
+        self._close_steps: List[Tuple[str, CloseStep]] = []
+
+    def spawn(self, coro: Awaitable, name: Optional[str] = None) -> asyncio.Task:
+        """Run ``coro`` in the background; shutdown waits for it (up to the deadline)."""
+        task = asyncio.ensure_future(coro)
+        if name:
+            task.set_name(name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def run_periodic(self, name: str, interval: float,
+                     fn: Callable[[], Awaitable[None]]) -> asyncio.Task:
+        """
+        Call ``fn`` every ``interval`` seconds until shutdown begins (first call
+        immediately). Errors are logged and the loop keeps going.
+        """
+        async def _loop():
+            while True:
+                try:
+                    await fn()
+                except Exception as exc:
+                    print(f"❌ Periodic task '{name}' failed: {exc}")
+                await asyncio.sleep(interval)
+
+        task = asyncio.ensure_future(_loop())
+        task.set_name(name)
+        self._periodic.add(task)
+        task.add_done_callback(self._periodic.discard)
+        return task
+
+    def run_job(self, name: str, interval: float,
+                fn: Callable[[], Awaitable[None]]) -> asyncio.Task:
+        """
+        Like run_periodic, for work that must not be cut off halfway (e.g. a
+        copy-then-delete). Each run is a tracked task, so shutdown stops
+        scheduling new runs but waits for the current one; ``fn`` should
+        check ``accepting`` between steps and return early.
+        """
+        async def _run():
+            try:
+                await fn()
+            except Exception as exc:
+                print(f"❌ Job '{name}' failed: {exc}")
+
+        async def _loop():
+            while self.accepting:
+                # Shielded: cancelling the schedule must not cancel the run itself
+                await asyncio.shield(self.spawn(_run(), name=name))
+                await asyncio.sleep(interval)
+
+        task = asyncio.ensure_future(_loop())
+        task.set_name(f"{name}-schedule")
+        self._periodic.add(task)
+        task.add_done_callback(self._periodic.discard)
+        return task
+
+    def add_drain_step(self, name: str, step: DrainStep) -> None:
+        self._drain_steps.append((name, step))
+
+    def add_close_step(self, name: str, step: CloseStep) -> None:
+        self._close_steps.append((name, step))
+
+    def start(self) -> None:
+        self.accepting = True
+
+    @property
+    def pending_tasks(self) -> int:
+        return len(self._tasks)
+
+    async def shutdown(self) -> None:
+        self.accepting = False
+        deadline = time.monotonic() + self.drain_timeout
+
+        # Periodic refreshers/probes have nothing to finish; stop them first.
+        # Job schedules stop too, but a run in progress is a tracked task below
+        for task in list(self._periodic):
+            task.cancel()
+        if self._periodic:
+            await asyncio.wait(set(self._periodic))
+
+        if self._tasks:
+            print(f"⏳ Waiting for {len(self._tasks)} background task(s)...")
+            _, pending = await asyncio.wait(set(self._tasks), timeout=self.drain_timeout)
+            for task in pending:
+                print(f"⚠️ Cancelling background task {task.get_name()} (drain deadline)")
+                task.cancel()
+
+        for name, step in self._drain_steps:
+            remaining = max(0.0, deadline - time.monotonic())
+            try:
+                await asyncio.wait_for(step(remaining), timeout=remaining or 0.001)
+            except asyncio.TimeoutError:
+                print(f"⚠️ Drain step '{name}' did not finish before the deadline")
+            except Exception as exc:
+                print(f"❌ Drain step '{name}' failed: {exc}")
+
+        for name, step in self._close_steps:
+            try:
+                await step()
+            except Exception as exc:
+                print(f"❌ Closing '{name}' failed: {exc}")
+        print("👋 Shutdown complete.")
+
+
+lifecycle = LifecycleManager(drain_timeout=settings.shutdown_drain_timeout)
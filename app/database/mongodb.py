@@ -1,22 +1,85 @@
 # app/database/mongodb.py
-from motor.motor_asyncio import AsyncIOMotorClient  # type: ignore
 import os
+import socket
+from datetime import datetime, timedelta
+
+from motor.motor_asyncio import AsyncIOMotorClient  # type: ignore
+from pymongo import monitoring
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+
+_MONGO_URI = settings.mongo_uri
+_DB_NAME = settings.mongo_db_name
+
+
+
+class PoolStats(monitoring.ConnectionPoolListener):
+    """
+    Connection pool counters fed by pymongo's pool events, for /readyz.
+    Events arrive from driver threads; the counts are for monitoring, not accounting.
+    """
+
+    def __init__(self):
+        self.open = 0
+        self.checked_out = 0
+        self.checkout_failures = 0
+
+    def connection_created(self, event):
+        self.open += 1
+
+    def connection_closed(self, event):
+        self.open -= 1
+
+    def connection_checked_out(self, event):
+        self.checked_out += 1
+
+    def connection_checked_in(self, event):
+        self.checked_out -= 1
+
+    def connection_check_out_failed(self, event):
+        self.checkout_failures += 1
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
 
-_MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-_DB_NAME = os.getenv("MONGO_DB_NAME", "contact_db")
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def as_dict(self) -> dict:
+        return {
+            "open": self.open,
+            "checked_out": self.checked_out,
+            "checkout_failures": self.checkout_failures,
+        }
+
+
+pool_stats = PoolStats()
 
 client: AsyncIOMotorClient | None = None
+# Motor clients must not cross a fork; remember which process created ours
+_client_pid: int | None = None
 
 
 async def connect_to_mongo():
-    global client
+    global client, _client_pid
     print(f"Connecting to MongoDB at {_MONGO_URI}...")
     print(f"Using database: {_DB_NAME}")
-    if client is not None:
+    if client is not None and _client_pid == os.getpid():
         print("MongoDB client already initialized.")
         return
     try:
-        client = AsyncIOMotorClient(_MONGO_URI)
+        client = AsyncIOMotorClient(_MONGO_URI, event_listeners=[pool_stats])
+        _client_pid = os.getpid()
         # Test the connection
         await client.admin.command('ping')
         print("Successfully connected to MongoDB!")
@@ -25,13 +88,76 @@ async def connect_to_mongo():
         raise
 
 
+async def ensure_indexes():
+    """
+    Create the indexes the API relies on. create_index is a no-op when the
+    index already exists, so this is safe to run on every startup.
+    """
+    db = get_db()
+    # Dashboard list filters, each ending in the list's (created_at, _id) sort so
+    # filtered pages are bounded index scans; the email one also serves exact lookups
+    await db["contacts"].create_index([("created_at", -1), ("_id", -1)])
+    await db["contacts"].create_index([("services", 1), ("created_at", -1), ("_id", -1)])
+    await db["contacts"].create_index(
+        [("email_normalized", 1), ("created_at", -1), ("_id", -1)]
+    )
+    # One document per submission fingerprint; legacy rows without one are exempt
+    await db["contacts"].create_index(
+        "fingerprint",
+        unique=True,
+        partialFilterExpression={"fingerprint": {"$exists": True}},
+    )
+    # Stored Idempotency-Key responses expire on their own
+    await db["idempotency_keys"].create_index(
+        "created_at", expireAfterSeconds=settings.idempotency_ttl_seconds
+    )
+    # Lead-grouped dashboard view, newest activity first
+    await db["leads"].create_index([("last_seen", -1), ("_id", -1)])
+    # Notification outbox, claimed oldest-due first
+    await db["notification_outbox"].create_index("available_at")
+    await db["users"].create_index("email", unique=True)
+    # Refresh tokens and revoked access-token ids drop out once they'd be expired anyway
+    await db["refresh_tokens"].create_index("expires_at", expireAfterSeconds=0)
+    await db["revoked_tokens"].create_index("expires_at", expireAfterSeconds=0)
+
+
+def _lease_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def try_acquire_lease(name: str, ttl_seconds: float) -> bool:
+    """
+    Cross-worker (and cross-host) election: the first caller gets the lease
+    for ``ttl_seconds`` and everyone else gets False until it expires. Used so
+    only one uvicorn worker runs startup chores such as index creation.
+    """
+    db = get_db()
+    now = datetime.utcnow()
+    lease = {"owner": _lease_owner(), "expires_at": now + timedelta(seconds=ttl_seconds)}
+    try:
+        await db["leases"].insert_one({"_id": name, **lease})
+        return True
+    except DuplicateKeyError:
+        taken = await db["leases"].find_one_and_update(
+            {"_id": name, "expires_at": {"$lt": now}}, {"$set": lease}
+        )
+        return taken is not None
+
+
+async def release_lease(name: str) -> None:
+    """Give up a lease early so the next caller need not wait out its TTL. Only the owner can."""
+    await get_db()["leases"].delete_one({"_id": name, "owner": _lease_owner()})
+
+
 async def close_mongo_connection():
+    global client
     if client:
         client.close()
+        client = None
 
 
 def get_db():
-    if client is None:
+    if client is None or _client_pid != os.getpid():
         raise RuntimeError("Mongo client not initialised")
     
     # If the URI already contains the database name, use it directly
@@ -0,0 +1,31 @@
+# app/dependencies/auth.py
+from typing import Any, Dict
+
+from fastapi import HTTPException, Request, status
+
+from app.services.auth_service import verify_access_token
+from app.utils.tokens import TokenError
+
+ADMIN_ROLE = "admin"
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def require_admin(request: Request) -> Dict[str, Any]:
+    """Validate the Bearer access token; returns its claims. No database lookup."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise _unauthorized("Not authenticated")
+    try:
+        claims = verify_access_token(token.strip())
+    except TokenError as exc:
+        raise _unauthorized(str(exc))
+    if claims.get("role") != ADMIN_ROLE:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return claims
@@ -1,5 +1,27 @@
 # app/dependencies/email_provider.py
-from app.utils.email_utils import EmailSender
+from typing import TYPE_CHECKING, Optional
 
-# Create one global instance to reuse across the app
-email_sender = EmailSender()
+if TYPE_CHECKING:
+    from app.utils.email_utils import EmailSender
+
+# Built on first use rather than at import, so the app (and tests/CLI tools that
+# import it) starts without SMTP configured and without paying for mail setup.
+_email_sender: Optional["EmailSender"] = None
+_email_sender_error: Optional[Exception] = None
+
+
+def get_email_sender() -> Optional["EmailSender"]:
+    """
+    Return the shared EmailSender, creating it on first call.
+    Returns None (and logs once) when SMTP isn't configured.
+    """
+    global _email_sender, _email_sender_error
+    if _email_sender is None and _email_sender_error is None:
+        from app.utils.email_utils import EmailSender
+
+        try:
+            _email_sender = EmailSender()
+        except EnvironmentError as exc:
+            _email_sender_error = exc
+            print(f"⚠️ Email notifications disabled: {exc}")
+    return _email_sender
@@ -0,0 +1,41 @@
+# app/dependencies/idempotency.py
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, Optional
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+
+from app.services import idempotency_service
+from app.services.idempotency_service import IdempotentCall
+
+
+@asynccontextmanager
+async def idempotent_request(scope: str, key: Optional[str], payload: Dict[str, Any],
+                             guard: Optional[AsyncContextManager] = None
+                             ) -> AsyncIterator[IdempotentCall]:
+    """idempotency_service.idempotent, with its errors answered as 400/422/409."""
+    try:
+        async with idempotency_service.idempotent(scope, key, payload, guard) as call:
+            yield call
+    except idempotency_service.InvalidIdempotencyKey as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except idempotency_service.IdempotencyKeyReused:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used with a different request body",
+        )
+    except idempotency_service.IdempotencyKeyInProgress:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is still being processed",
+            headers={"Retry-After": "1"},
+        )
+
+
+def replay_response(stored: Dict[str, Any]) -> JSONResponse:
+    """The stored first response, marked as a replay."""
+    return JSONResponse(
+        status_code=stored["status_code"],
+        content=stored["body"],
+        headers={"Idempotent-Replayed": "true"},
+    )
@@ -0,0 +1,88 @@
+# app/dependencies/rate_limit.py
+import math
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.lifecycle import lifecycle
+from app.utils.rate_limit import AdmissionController, KeyedRateLimiter, TokenBucket
+
+# Shared by every public contact-submission endpoint
+per_ip_limiter = KeyedRateLimiter(
+    rate=settings.contact_rate_per_ip, burst=settings.contact_burst_per_ip
+)
+global_limiter = TokenBucket(
+    rate=settings.contact_rate_global, burst=settings.contact_burst_global
+)
+write_admission = AdmissionController(max_in_flight=settings.contact_max_in_flight)
+# Slows password guessing; bcrypt makes each attempt expensive for us too
+login_limiter = KeyedRateLimiter(
+    rate=settings.login_rate_per_ip, burst=settings.login_burst_per_ip
+)
+
+
+def _client_ip(request: Request) -> str:
+    if settings.trust_forwarded_for:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",", 1)[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _retry_after(seconds: float) -> dict:
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
+
+
+@asynccontextmanager
+async def contact_write_guard(request: Request) -> AsyncIterator[None]:
+    """
+    Rate-limit and admission-control a contact submission before it reaches
+    Mongo or SMTP. Per-IP and global limits answer 429; too many writes in
+    flight, or a server that is shutting down, answer 503. All carry Retry-After.
+
+    Entered by the endpoints themselves, after an Idempotency-Key replay has
+    been ruled out, so a client retrying a stored request is not throttled.
+    """
+    if not lifecycle.accepting:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is shutting down, please retry",
+            headers=_retry_after(1),
+        )
+    wait = per_ip_limiter.acquire(_client_ip(request))
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many submissions from this address, please retry later",
+            headers=_retry_after(wait),
+        )
+    wait = global_limiter.acquire()
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many submissions, please retry later",
+            headers=_retry_after(wait),
+        )
+    if not write_admission.try_enter():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry shortly",
+            headers=_retry_after(1),
+        )
+    try:
+        yield
+    finally:
+        write_admission.leave()
+
+
+async def login_guard(request: Request) -> None:
+    """Per-IP limit on login attempts; 429 with Retry-After when exceeded."""
+    wait = login_limiter.acquire(_client_ip(request))
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please retry later",
+            headers=_retry_after(wait),
+        )
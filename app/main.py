@@ -1,15 +1,77 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-from app.database.mongodb import connect_to_mongo, close_mongo_connection
+from app.database.mongodb import (
+    connect_to_mongo, close_mongo_connection, ensure_indexes, release_lease,
+    try_acquire_lease,
+)
 from app.api.v1.endpoints.contact import router as contact_v1_router
+from app.api.v1.endpoints.users import router as users_v1_router
+from app.api.v1.endpoints.auth import router as auth_v1_router
+from app.api.v1.endpoints.leads import router as leads_v1_router
 from app.routes.contact import router as public_contact_router  # optional
+from app.routes.health import router as health_router
+from app.services.notification_service import notification_service
+from app.services.notification_routing import notification_router
+from app.core.lifecycle import lifecycle
+from app.dependencies.rate_limit import write_admission
+from app.middleware.compression import CompressionMiddleware
+from app.core.config import settings
+from app.services.auth_service import get_signer, refresh_revocations
+from app.services import credential_service, spam_service
+from app.services.health_service import health_monitor
+from app.services.archive_service import archive_old_contacts, ensure_archive_collection
+
+
+# Shutdown order: finish in-flight writes, flush queued mail, then close pools
+lifecycle.add_drain_step("contact writes", lambda timeout: write_admission.wait_idle())
+lifecycle.add_drain_step("notification queue", notification_service.drain)
+lifecycle.add_close_step("notification worker", notification_service.stop)
+lifecycle.add_close_step("smtp", notification_service.close_sender)
+lifecycle.add_close_step("mongo", close_mongo_connection)
+lifecycle.add_close_step("password hashing", lambda: asyncio.to_thread(credential_service.shutdown))
+lifecycle.add_close_step("spam scoring", lambda: asyncio.to_thread(spam_service.shutdown))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    lifecycle.start()
+    get_signer()  # fail fast on a missing JWT_SECRET in production
+    await connect_to_mongo()
+    # With several workers only the elected one builds indexes. The lease is
+    # released when done (or failed) so the next restart runs them again
+    if await try_acquire_lease("ensure-indexes", ttl_seconds=60):
+        try:
+            await ensure_indexes()
+            await ensure_archive_collection()
+        finally:
+            await release_lease("ensure-indexes")
+    notification_service.start()
+    lifecycle.spawn(notification_service.warm(), name="smtp-warmup")
+    lifecycle.spawn(spam_service.warm(), name="spam-warmup")
+    lifecycle.run_periodic("health-probe", settings.health_probe_interval, health_monitor.refresh)
+    lifecycle.run_periodic(
+        "revocation-refresh", settings.revocation_refresh_interval, refresh_revocations
+    )
+    lifecycle.run_periodic(
+        "notification-rules-refresh",
+        settings.notification_rules_refresh_interval,
+        notification_router.reload,
+    )
+    if settings.archive_after_days > 0:
+        # A tracked job: shutdown lets the current batch finish its copy and delete
+        lifecycle.run_job(
+            "contact-archival", settings.archive_interval_seconds, archive_old_contacts
+        )
 
-app = FastAPI()
+    yield
+
+    await lifecycle.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,19 +87,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the dashboard read pagination/caching headers from list and detail responses
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "ETag"],
 )
 
-
-@app.on_event("startup")
-async def _startup():
-    await connect_to_mongo()
-
-
-@app.on_event("shutdown")
-async def _shutdown():
-    await close_mongo_connection()
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+    zstd_level=settings.compression_zstd_level,
+    compress_streams=settings.compression_compress_streams,
+)
 
 
 # register routes
 app.include_router(contact_v1_router)
+app.include_router(users_v1_router)
+app.include_router(auth_v1_router)
+app.include_router(leads_v1_router)
 app.include_router(public_contact_router)  # remove if unused
+app.include_router(health_router)
@@ -0,0 +1,214 @@
+# app/middleware/compression.py
+import zlib
+from typing import Callable, Dict, Optional, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # optional, preferred when the client accepts it
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:  # optional
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Already-compressed or latency-sensitive content is passed through untouched
+_SKIP_CONTENT_TYPES = ("image/", "video/", "audio/", "application/zip",
+                       "application/gzip", "text/event-stream")
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+    def finish(self) -> bytes: ...
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _Brotli:
+    def __init__(self, quality: int):
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class CompressionMiddleware:
+    """
+    Compress HTTP responses with br, zstd or gzip (in that order of preference,
+    limited to what the client accepts and what is installed).
+
+    * Bodies smaller than ``minimum_size`` are sent as-is; compressing them
+      costs more CPU than it saves on the wire.
+    * Streaming responses are compressed incrementally: chunks are buffered
+      until at least ``minimum_size`` bytes are waiting, then compressed and
+      flushed, so clients still receive data as it comes without every tiny
+      chunk paying for its own flush. Set ``compress_streams=False`` to pass
+      them through instead.
+    * A strong ETag is weakened (``W/``) on compressed responses: the bytes
+      differ per encoding, only the representation is the same.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, gzip_level: int = 6,
+                 brotli_quality: int = 4, zstd_level: int = 3, compress_streams: bool = True):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compress_streams = compress_streams
+        self._factories: Dict[str, Callable[[], _Compressor]] = {}
+        if brotli is not None:
+            self._factories["br"] = lambda: _Brotli(brotli_quality)
+        if zstandard is not None:
+            self._factories["zstd"] = lambda: _Zstd(zstd_level)
+        self._factories["gzip"] = lambda: _Gzip(gzip_level)
+
+    def _negotiate(self, accept_encoding: str) -> Optional[str]:
+        accepted = set()
+        for part in accept_encoding.lower().split(","):
+            token, _, params = part.strip().partition(";")
+            q = params.strip()
+            if q.startswith("q="):
+                try:
+                    if float(q[2:]) <= 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.add(token.strip())
+        for encoding in self._factories:  # server preference order
+            if encoding in accepted or "*" in accepted:
+                return encoding
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = self._negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(
+            self.app, encoding, self._factories[encoding],
+            self.minimum_size, self.compress_streams,
+        )
+        await responder(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, factory: Callable[[], _Compressor],
+                 minimum_size: int, compress_streams: bool):
+        self.app = app
+        self.encoding = encoding
+        self.factory = factory
+        self.minimum_size = minimum_size
+        self.compress_streams = compress_streams
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+        self.pending = bytearray()  # streamed input not yet compressed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self._send)
+
+    async def _send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the headers until we've seen the first body chunk
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or content_type.startswith(_SKIP_CONTENT_TYPES)
+            )
+            return
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            await self._begin(start, message)
+            return
+
+        if self.compressor is None:
+            await self.send(message)
+            return
+
+        await self._stream(message.get("body", b""), message.get("more_body", False))
+
+    async def _stream(self, chunk: bytes, more_body: bool) -> None:
+        self.pending += chunk
+        if more_body and len(self.pending) < self.minimum_size:
+            return  # a flush per tiny chunk would cost more than it saves
+        body = self.compressor.compress(bytes(self.pending))
+        self.pending.clear()
+        body += self.compressor.flush() if more_body else self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _begin(self, start: Message, message: Message) -> None:
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.passthrough or (not more_body and len(body) < self.minimum_size) or (
+            more_body and not self.compress_streams
+        ):
+            await self.send(start)
+            await self.send(message)
+            return
+
+        self.compressor = self.factory()
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+
+        if more_body:
+            # Length unknown up front; chunked transfer
+            del headers["Content-Length"]
+            await self.send(start)
+            await self._stream(body, more_body)
+            return
+
+        body = self.compressor.compress(body) + self.compressor.finish()
+        headers["Content-Length"] = str(len(body))
+        await self.send(start)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
@@ -0,0 +1,21 @@
+"""
+Versioned data migrations, applied in order by ``python -m app.migrations``.
+
+Add a module named ``mNNNN_<what>.py`` defining ``MIGRATION`` and append it
+below; never renumber or edit one that has run in production.
+"""
+from app.migrations import (
+    m0001_default_fields,
+    m0002_email_normalized,
+    m0003_fingerprints,
+    m0004_versions,
+    m0005_rebuild_leads,
+)
+
+MIGRATIONS = [
+    m0001_default_fields.MIGRATION,
+    m0002_email_normalized.MIGRATION,
+    m0003_fingerprints.MIGRATION,
+    m0004_versions.MIGRATION,
+    m0005_rebuild_leads.MIGRATION,
+]
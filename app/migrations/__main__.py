@@ -0,0 +1,75 @@
+"""
+Apply pending data migrations.
+
+    python -m app.migrations --list
+    python -m app.migrations --dry-run
+    python -m app.migrations --batch-size 1000 --sleep 0.05
+    python -m app.migrations --only 0003_fingerprints
+"""
+import argparse
+import asyncio
+import sys
+
+from app.database.mongodb import close_mongo_connection, connect_to_mongo, get_db
+from app.migrations import MIGRATIONS
+from app.migrations.runner import MigrationNotReady, run_migration
+
+
+async def _list() -> None:
+    done = {
+        doc["_id"]: doc for doc in await get_db()["migrations"].find().to_list(None)
+    }
+    for migration in MIGRATIONS:
+        state = done.get(migration.id, {})
+        if state.get("completed_at"):
+            status = f"done {state['completed_at']:%Y-%m-%d %H:%M}"
+        elif state:
+            status = "in progress"
+        else:
+            status = "pending"
+        print(f"{migration.id:<28} {status:<22} {migration.description}")
+
+
+async def _run(args) -> None:
+    selected = [m for m in MIGRATIONS if not args.only or m.id in args.only]
+    unknown = set(args.only or ()) - {m.id for m in MIGRATIONS}
+    if unknown:
+        sys.exit(f"Unknown migration(s): {', '.join(sorted(unknown))}")
+
+    for migration in selected:
+        print(f"▶️  {migration.id}: {migration.description}"
+              f"{' (dry run)' if args.dry_run else ''}")
+        try:
+            result = await run_migration(
+                migration, batch_size=args.batch_size, sleep=args.sleep, dry_run=args.dry_run
+            )
+        except MigrationNotReady as e:
+            if not args.dry_run:
+                sys.exit(f"❌ {e}")
+            # A dry run applies nothing, so later migrations cannot be previewed
+            print(f"   skipped: {e}")
+            continue
+        if result.already_done:
+            print("   already applied")
+        else:
+            verb = "would update" if args.dry_run else "updated"
+            print(f"✅ scanned {result.scanned}, {verb} {result.modified}, "
+                  f"skipped {result.skipped}")
+
+
+async def main(args) -> None:
+    await connect_to_mongo()
+    try:
+        await (_list() if args.list else _run(args))
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply pending data migrations")
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--sleep", type=float, default=0.1, help="seconds to pause between batches")
+    parser.add_argument("--only", nargs="+", metavar="ID", help="run just these migrations")
+    parser.add_argument("--list", action="store_true", help="show which migrations have run")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,31 @@
+# app/migrations/base.py
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Migration:
+    """
+    One versioned backfill over a collection.
+
+    ``query`` selects the documents that still need it and is re-applied to
+    every write, so a row fixed by live traffic in the meantime is left
+    alone and re-running a migration is harmless. ``transform`` returns the
+    fields to ``$set`` on one document (empty or None to skip it).
+
+    Migrations that write elsewhere (e.g. rebuilding a derived collection)
+    set ``apply_batch`` instead: it receives each batch and returns how many
+    documents it changed. It must be idempotent, since a batch is replayed
+    when a run is interrupted before its checkpoint.
+
+    ``requires`` lists the ids of migrations that must have completed first;
+    the runner refuses to start otherwise.
+    """
+    id: str
+    description: str
+    query: Dict[str, Any]
+    transform: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = None
+    collection: str = "contacts"
+    projection: Optional[Dict[str, int]] = field(default=None)
+    apply_batch: Optional[Callable[[List[Dict[str, Any]]], Awaitable[int]]] = None
+    requires: Tuple[str, ...] = ()
@@ -0,0 +1,22 @@
+# Rows from before validation existed can miss fields the API expects
+from app.migrations.base import Migration
+
+_TEXT_FIELDS = ("first_name", "last_name", "email", "phone_number", "message")
+
+
+def _transform(doc):
+    changes = {name: "" for name in _TEXT_FIELDS if name not in doc}
+    if "services" not in doc:
+        changes["services"] = []
+    if "created_at" not in doc:
+        # ObjectIds carry their creation second; stored naive like created_at
+        changes["created_at"] = doc["_id"].generation_time.replace(tzinfo=None)
+    return changes
+
+
+MIGRATION = Migration(
+    id="0001_default_fields",
+    description="Fill missing contact fields and created_at",
+    query={"$or": [{name: {"$exists": False}} for name in (*_TEXT_FIELDS, "services", "created_at")]},
+    transform=_transform,
+)
@@ -0,0 +1,21 @@
+# Exact-match email filters and lead grouping read email_normalized
+from app.migrations.base import Migration
+from app.services.email_validation_service import normalize_email
+
+
+def _transform(doc):
+    email = (doc.get("email") or "").strip()
+    try:
+        return {"email_normalized": normalize_email(email)}
+    except ValueError:
+        # Keep legacy junk addresses findable rather than skipping them forever
+        return {"email_normalized": email.lower()}
+
+
+MIGRATION = Migration(
+    id="0002_email_normalized",
+    description="Backfill email_normalized",
+    query={"email_normalized": {"$exists": False}},
+    transform=_transform,
+    projection={"email": 1},
+)
@@ -0,0 +1,27 @@
+# Duplicate detection relies on the unique fingerprint index; legacy copies
+# of the same submission collide on it and are simply left without one
+from app.migrations.base import Migration
+from app.services.contact_service import fingerprint_for
+
+
+def _transform(doc):
+    if not doc.get("email_normalized") or not doc.get("created_at"):
+        return None  # legacy row without a usable address
+    return {
+        "fingerprint": fingerprint_for(
+            doc["email_normalized"],
+            doc.get("phone_number") or "",
+            doc.get("message") or "",
+            doc["created_at"],
+        )
+    }
+
+
+MIGRATION = Migration(
+    id="0003_fingerprints",
+    description="Backfill submission fingerprints",
+    query={"fingerprint": {"$exists": False}},
+    transform=_transform,
+    projection={"email_normalized": 1, "phone_number": 1, "message": 1, "created_at": 1},
+    requires=("0001_default_fields", "0002_email_normalized"),
+)
@@ -0,0 +1,21 @@
+# ETags and optimistic concurrency read version; the list shows updated_at
+from app.migrations.base import Migration
+
+
+def _transform(doc):
+    changes = {}
+    if "version" not in doc:
+        changes["version"] = 1
+    if "updated_at" not in doc and doc.get("created_at"):
+        changes["updated_at"] = doc["created_at"]
+    return changes
+
+
+MIGRATION = Migration(
+    id="0004_versions",
+    description="Backfill version and updated_at",
+    query={"$or": [{"version": {"$exists": False}}, {"updated_at": {"$exists": False}}]},
+    transform=_transform,
+    projection={"version": 1, "updated_at": 1, "created_at": 1},
+    requires=("0001_default_fields",),
+)
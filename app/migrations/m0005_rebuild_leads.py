@@ -0,0 +1,21 @@
+# Leads used to be written on insert only, so contacts stored before the
+# leads collection existed never got one; rebuild every lead from contacts
+from app.migrations.base import Migration
+from app.services.lead_service import rebuild_lead
+
+
+async def _apply_batch(docs):
+    emails = {doc["email_normalized"] for doc in docs}
+    for email in emails:
+        await rebuild_lead(email)
+    return len(emails)
+
+
+MIGRATION = Migration(
+    id="0005_rebuild_leads",
+    description="Rebuild leads from stored contacts",
+    query={"email_normalized": {"$exists": True}},
+    apply_batch=_apply_batch,
+    projection={"email_normalized": 1},
+    requires=("0001_default_fields", "0002_email_normalized"),
+)
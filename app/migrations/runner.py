@@ -0,0 +1,122 @@
+# app/migrations/runner.py
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from app.database.mongodb import get_db
+from app.migrations.base import Migration
+
+_DUPLICATE_KEY = 11000
+
+
+class MigrationNotReady(RuntimeError):
+    """A migration was run before the ones it ``requires`` completed."""
+
+
+@dataclass
+class MigrationResult:
+    scanned: int = 0
+    modified: int = 0
+    skipped: int = 0
+    already_done: bool = False
+
+
+async def _checkpoint(db, migration_id: str, last_id: Any, scanned: int, modified: int) -> None:
+    await db["migrations"].update_one(
+        {"_id": migration_id},
+        {"$set": {"last_id": last_id}, "$inc": {"scanned": scanned, "modified": modified}},
+    )
+
+
+async def run_migration(migration: Migration, batch_size: int = 500,
+                        sleep: float = 0.1, dry_run: bool = False) -> MigrationResult:
+    """
+    Apply ``migration`` in ``_id`` order, one batch per bulk_write.
+
+    The last ``_id`` of every batch is checkpointed in the ``migrations``
+    collection, so an interrupted run resumes where it stopped. ``sleep``
+    seconds between batches keep the backfill from starving live traffic.
+    A dry run writes nothing, checkpoints included, and reports what it would do.
+    Raises MigrationNotReady if a migration it ``requires`` has not completed,
+    since its ``transform`` would otherwise skip rows and still be marked done.
+    """
+    db = get_db()
+    state = await db["migrations"].find_one({"_id": migration.id}) or {}
+    if state.get("completed_at"):
+        return MigrationResult(already_done=True)
+    if migration.requires:
+        done = await db["migrations"].distinct(
+            "_id", {"_id": {"$in": list(migration.requires)}, "completed_at": {"$exists": True}}
+        )
+        missing = [m for m in migration.requires if m not in done]
+        if missing:
+            raise MigrationNotReady(f"{migration.id} requires {', '.join(missing)} first")
+
+    result = MigrationResult()
+    last_id = state.get("last_id")
+    if not dry_run and not state:
+        await db["migrations"].insert_one(
+            {"_id": migration.id, "description": migration.description,
+             "started_at": datetime.utcnow()}
+        )
+
+    collection = db[migration.collection]
+    while True:
+        query: Dict[str, Any] = dict(migration.query)
+        if last_id is not None:
+            query = {"$and": [migration.query, {"_id": {"$gt": last_id}}]}
+        docs = await (
+            collection.find(query, migration.projection).sort("_id", 1)
+            .limit(batch_size).to_list(batch_size)
+        )
+        if not docs:
+            break
+
+        result.scanned += len(docs)
+        last_id = docs[-1]["_id"]
+        if migration.apply_batch is not None:
+            modified = len(docs) if dry_run else await migration.apply_batch(docs)
+            result.modified += modified
+            if not dry_run:
+                await _checkpoint(db, migration.id, last_id, len(docs), modified)
+            await asyncio.sleep(sleep)
+            continue
+
+        ops = []
+        for doc in docs:
+            changes = migration.transform(doc)
+            if changes:
+                # Re-check the selector so rows fixed meanwhile are not overwritten
+                ops.append(UpdateOne({"$and": [{"_id": doc["_id"]}, migration.query]},
+                                     {"$set": changes}))
+            else:
+                result.skipped += 1
+
+        if dry_run:
+            result.modified += len(ops)
+            continue
+
+        modified = 0
+        if ops:
+            try:
+                modified = (await collection.bulk_write(ops, ordered=False)).modified_count
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                if any(err.get("code") != _DUPLICATE_KEY for err in errors):
+                    raise
+                # Unique-index collisions (e.g. legacy duplicate submissions) stay as they are
+                modified = e.details.get("nModified", 0)
+                result.skipped += len(errors)
+        result.modified += modified
+        await _checkpoint(db, migration.id, last_id, len(docs), modified)
+        await asyncio.sleep(sleep)
+
+    if not dry_run:
+        await db["migrations"].update_one(
+            {"_id": migration.id}, {"$set": {"completed_at": datetime.utcnow()}}
+        )
+    return result
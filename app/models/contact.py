@@ -1,45 +0,0 @@
-from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
-from bson import ObjectId
-
-class PyObjectId(ObjectId):
-    @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
-
-    @classmethod
-    def validate(cls, v):
-        if not ObjectId.is_valid(v):
-            raise ValueError("Invalid ObjectId")
-        return ObjectId(v)
-
-    @classmethod
-    def __modify_schema__(cls, field_schema):
-        field_schema.update(type="string")
-
-class ContactModel(BaseModel):
-    id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
-    first_name: str = Field(..., min_length=1, max_length=100)
-    last_name: str = Field(..., min_length=1, max_length=100)
-    email: EmailStr = Field(...)
-    phone_number: str = Field(..., min_length=10, max_length=20)
-    message: str = Field(..., min_length=1, max_length=2000)
-    services: List[str] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        allow_population_by_field_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        schema_extra = {
-            "example": {
-                "first_name": "John",
-                "last_name": "Doe",
-                "email": "john.doe@example.com",
-                "phone_number": "+1234567890",
-                "message": "I'm interested in your web development services.",
-                "services": ["Web Development", "SEO"],
-                "created_at": "2024-01-01T00:00:00Z"
-            }
-        }
@@ -1,16 +1,15 @@
 from dataclasses import dataclass
 from typing import Optional
-from email_validator import validate_email, EmailNotValidError
+
+from app.services.email_validation_service import normalize_email
 
 @dataclass
 class UserInDB:
     id: Optional[str]
     email: str
     hashed_password: str
+    role: str = "user"
 
     def __post_init__(self):
         if self.email:
-            try:
-                validate_email(self.email)
-            except EmailNotValidError:
-                raise ValueError("Invalid email format")
\ No newline at end of file
+            normalize_email(self.email)  # raises ValueError("Invalid email format")
\ No newline at end of file
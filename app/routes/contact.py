@@ -1,108 +1,83 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Request
-from dataclasses import dataclass
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.responses import JSONResponse
 from typing import Any
-from datetime import datetime
-from email_validator import validate_email, EmailNotValidError
 
-from app.database.mongodb import get_db
-from app.dependencies.email_provider import email_sender  # Global email sender
+from app.schemas.contact import ContactCreate
+from app.services.contact_service import save_contact
+from app.services.notification_service import (
+    NotificationService, get_notification_service, SENT, QUEUED,
+)
+from app.dependencies.idempotency import idempotent_request, replay_response
+from app.dependencies.rate_limit import contact_write_guard
 
 router = APIRouter(tags=["public-contact"])
 
-
-@dataclass
-class ContactForm:
-    first_name: str
-    last_name: str
-    email: str
-    phone_number: str
-    message: str
-    services: list[str] = None
-
-    def __post_init__(self):
-        if self.services is None:
-            self.services = []
-        
-        # Validation
-        if not self.first_name:
-            raise ValueError("First name is required")
-        
-        if not self.last_name:
-            raise ValueError("Last name is required")
-        
-        if not self.email:
-            raise ValueError("Email is required")
-        
-        # Validate email format
-        try:
-            validate_email(self.email)
-        except EmailNotValidError:
-            raise ValueError("Invalid email format")
-        
-        if not self.phone_number:
-            raise ValueError("Phone number is required")
-        
-        if not self.message:
-            raise ValueError("Message is required")
-
-    def dict(self):
-        return {
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "email": self.email,
-            "phone_number": self.phone_number,
-            "message": self.message,
-            "services": self.services
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict):
-        return cls(
-            first_name=data.get("first_name", ""),
-            last_name=data.get("last_name", ""),
-            email=data.get("email", ""),
-            phone_number=data.get("phone_number", ""),
-            message=data.get("message", ""),
-            services=data.get("services", [])
-        )
+_IDEMPOTENCY_SCOPE = "POST /contact/"
 
 
 @router.post("/contact/", status_code=status.HTTP_201_CREATED)
-async def submit_contact(request: Request, db=Depends(get_db)):
+async def submit_contact(
+    request: Request,
+    notifications: NotificationService = Depends(get_notification_service),
+):
     try:
         # Parse JSON body manually
         body = await request.json()
         
-        # Create ContactForm instance
-        form = ContactForm.from_dict(body)
-        
-        print("✅ Form data received:")
-        print(form.dict())  # DEBUG: Show received form data
-
-        contact_data: dict[str, Any] = form.dict()
-        contact_data["created_at"] = datetime.utcnow()
-
-        print("📦 Inserting into MongoDB...")
-        result = await db["contacts"].insert_one(contact_data)
-        print(f"🟢 Saved to DB. ID: {result.inserted_id}")
-
-        print("📤 Sending email...")
-        await email_sender.send_contact_email(contact_data)
-        print("✅ Email sent successfully.")
-
-        return {
-            "message": "Contact saved and email sent successfully.",
-            "id": str(result.inserted_id),
-        }
-
+        # Validate with the shared contact schema
+        form = ContactCreate.from_dict(body)
     except ValueError as ve:
         print(f"❌ Validation error: {ve}")
         raise HTTPException(
             status_code=400, detail=f"Validation error: {ve}"
         )
-    except Exception as exc:
-        print("❌ Error occurred during contact form processing:")
-        print(exc)  # DEBUG: Print the full error to console
-        raise HTTPException(
-            status_code=500, detail=f"Failed to save or send email: {exc}"
-        )
+
+    async with idempotent_request(
+        _IDEMPOTENCY_SCOPE, request.headers.get("Idempotency-Key"), form.dict(),
+        guard=contact_write_guard(request),
+    ) as call:
+        if call.replay is not None:
+            print("🔁 Replaying stored response for Idempotency-Key")
+            return replay_response(call.replay)
+
+        try:
+            print("✅ Form data received:")
+            print(form.dict())  # DEBUG: Show received form data
+
+            contact_data: dict[str, Any] = form.dict()
+
+            print("📦 Inserting into MongoDB...")
+            saved = await save_contact(form)
+            if saved.duplicate:
+                print(f"🔁 Duplicate submission of {saved.id}, email not re-sent.")
+                status_code = status.HTTP_200_OK
+                body = {"message": "Duplicate submission ignored.", "id": saved.id}
+            elif saved.spam:
+                print(f"🚫 Saved {saved.id} as spam, email not sent.")
+                status_code = status.HTTP_201_CREATED
+                body = {"message": "Contact saved.", "id": saved.id}
+            else:
+                print(f"🟢 Saved to DB. ID: {saved.id}")
+
+                print("📤 Sending email...")
+                status_code = status.HTTP_201_CREATED
+                outcome = await notifications.notify_contact(contact_data)
+                if outcome == SENT:
+                    print("✅ Email sent successfully.")
+                    message = "Contact saved and email sent successfully."
+                elif outcome == QUEUED:
+                    print("📨 Email queued for retry.")
+                    message = "Contact saved; email notification queued."
+                else:
+                    message = "Contact saved; email notifications are disabled."
+                body = {"message": message, "id": saved.id}
+
+        except Exception as exc:
+            print("❌ Error occurred during contact form processing:")
+            print(exc)  # DEBUG: Print the full error to console
+            raise HTTPException(
+                status_code=500, detail=f"Failed to save or send email: {exc}"
+            )
+
+        call.complete(status_code, body)
+    return JSONResponse(status_code=status_code, content=body)
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Response, status
+
+from app.core.lifecycle import lifecycle
+from app.services.health_service import health_monitor
+
+router = APIRouter(tags=["health"])
+
+_ALIVE = b'{"status":"ok"}'
+_DRAINING = b'{"status":"shutting_down"}'
+
+
+@router.get("/healthz")
+async def healthz():
+    """Liveness: the process is up and its event loop answers. Touches no dependency."""
+    return Response(content=_ALIVE, media_type="application/json")
+
+
+@router.get("/readyz")
+async def readyz():
+    """
+    Readiness from the last background probe: Mongo ping latency and pool,
+    SMTP breaker state, queue depths. 503 while Mongo is down, the probe is
+    stale, or the app is draining for shutdown.
+    """
+    if not lifecycle.accepting:
+        return Response(
+            content=_DRAINING, media_type="application/json",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+    ready = health_monitor.ready and health_monitor.fresh
+    return Response(
+        content=health_monitor.body,
+        media_type="application/json",
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class LoginRequest:
+    email: str
+    password: str
+
+
+@dataclass
+class RefreshRequest:
+    refresh_token: str
+
+
+@dataclass
+class LogoutRequest:
+    refresh_token: Optional[str] = None
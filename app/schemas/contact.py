@@ -1,114 +1,167 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-import re
-from email_validator import validate_email, EmailNotValidError
+
+from app.services.email_validation_service import normalize_email
+
+# Length limits for every text field of a contact (min, max). This is the single
+# place the rules live; the public form and the admin API both validate with it.
+FIELD_LIMITS: Dict[str, tuple] = {
+    "first_name": (1, 100),
+    "last_name": (1, 100),
+    "phone_number": (10, 20),
+    "message": (1, 2000),
+}
+
+_FIELD_LABELS = {
+    "first_name": "First name",
+    "last_name": "Last name",
+    "phone_number": "Phone number",
+    "message": "Message",
+}
+
+
+def _compile_rules() -> tuple:
+    """Pre-build (field, min, max, required_error, length_error) tuples once at import."""
+    rules = []
+    for name, (min_len, max_len) in FIELD_LIMITS.items():
+        label = _FIELD_LABELS[name]
+        rules.append((
+            name,
+            min_len,
+            max_len,
+            f"{label} is required",
+            f"{label} must be between {min_len} and {max_len} characters",
+        ))
+    return tuple(rules)
+
+
+_RULES = _compile_rules()
+
+
+def _check_text(name: str, value: Any, min_len: int, max_len: int,
+                required_error: str, length_error: str) -> str:
+    if not isinstance(value, str):
+        if value is None:
+            raise ValueError(required_error)
+        raise ValueError(f"{_FIELD_LABELS[name]} must be a string")
+    value = value.strip()
+    if not value:
+        raise ValueError(required_error)
+    if not min_len <= len(value) <= max_len:
+        raise ValueError(length_error)
+    return value
+
+
+def _check_email(value: Any) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("Email is required")
+    value = value.strip()
+    normalize_email(value)  # raises ValueError; result is cached for the insert path
+    return value
+
+
+def _check_services(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(s, str) for s in value):
+        raise ValueError("Services must be a list of strings")
+    return value
+
+
+def validate_contact_fields(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate the given contact fields and return a cleaned copy.
+
+    Only the keys present in ``values`` are checked, so the same rules serve
+    both full payloads and partial ones.
+    """
+    cleaned = dict(values)
+    for name, min_len, max_len, required_error, length_error in _RULES:
+        if name in cleaned:
+            cleaned[name] = _check_text(
+                name, cleaned[name], min_len, max_len, required_error, length_error
+            )
+    if "email" in cleaned:
+        cleaned["email"] = _check_email(cleaned["email"])
+    if "services" in cleaned:
+        cleaned["services"] = _check_services(cleaned["services"])
+    return cleaned
+
 
 @dataclass
-class ContactBase:
+class ContactCreate:
+    """Schema used when a new contact comes in from the public form or the admin API"""
     first_name: str
     last_name: str
     email: str
     phone_number: str
     message: str
-    services: List[str] = None
+    services: List[str] = field(default_factory=list)
+    # Honeypot: a field the form hides from people, so only bots fill it in.
+    # Never stored or mailed; the spam check reads it directly.
+    website: Optional[str] = None
 
     def __post_init__(self):
-        if self.services is None:
-            self.services = []
-        
-        # Validation
-        if not self.first_name or len(self.first_name.strip()) < 1:
-            raise ValueError("First name is required and must be at least 1 character")
-        
-        if not self.last_name:
-            raise ValueError("Last name is required")
-        
-        if not self.email:
-            raise ValueError("Email is required")
-        
-        # Validate email format
-        try:
-            validate_email(self.email)
-        except EmailNotValidError:
-            raise ValueError("Invalid email format")
-        
-        if not self.phone_number:
-            raise ValueError("Phone number is required")
-        
-        if not self.message:
-            raise ValueError("Message is required")
+        cleaned = validate_contact_fields(self.dict())
+        for name, value in cleaned.items():
+            setattr(self, name, value)
+
+    def dict(self) -> Dict[str, Any]:
+        values = asdict(self)
+        del values["website"]
+        return values
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ContactCreate":
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+        return cls(
+            first_name=data.get("first_name"),
+            last_name=data.get("last_name"),
+            email=data.get("email"),
+            phone_number=data.get("phone_number"),
+            message=data.get("message"),
+            services=data.get("services"),
+            website=data.get("website"),
+        )
+
 
 @dataclass
-class ContactCreate:
-    """Schema used when a new contact comes in from the public form"""
-    first_name: str
-    last_name: str
-    email: str
-    phone_number: str
-    message: str
-    services: List[str] = None
+class ContactUpdate:
+    """Schema for PATCH: every field optional, only the ones sent are validated and written"""
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    phone_number: Optional[str] = None
+    message: Optional[str] = None
+    services: Optional[List[str]] = None
 
     def __post_init__(self):
-        if self.services is None:
-            self.services = []
-        
-        # Validation
-        if not self.first_name or len(self.first_name.strip()) < 1:
-            raise ValueError("First name is required and must be at least 1 character")
-        
-        if not self.last_name:
-            raise ValueError("Last name is required")
-        
-        if not self.email:
-            raise ValueError("Email is required")
-        
-        # Validate email format
-        try:
-            validate_email(self.email)
-        except EmailNotValidError:
-            raise ValueError("Invalid email format")
-        
-        if not self.phone_number:
-            raise ValueError("Phone number is required")
-        
-        if not self.message:
-            raise ValueError("Message is required")
+        cleaned = validate_contact_fields(self.changes())
+        for name, value in cleaned.items():
+            setattr(self, name, value)
+
+    def changes(self) -> Dict[str, Any]:
+        return {name: value for name, value in asdict(self).items() if value is not None}
+
 
 @dataclass
 class ContactInDB:
-    """Schema returned by the API (contains an id string and timestamp)"""
+    """Schema returned by the API (contains an id string and timestamp)
+
+    Output only: documents were validated on the way in, so nothing is
+    re-checked here and legacy rows never turn a listing into a 500.
+    """
     first_name: str
     last_name: str
     email: str
     phone_number: str
     message: str
-    services: List[str] = None
+    services: List[str] = field(default_factory=list)
     id: str = ""
     created_at: Optional[datetime] = None
-
-    def __post_init__(self):
-        if self.services is None:
-            self.services = []
-        
-        # Validation
-        if not self.first_name or len(self.first_name.strip()) < 1:
-            raise ValueError("First name is required and must be at least 1 character")
-        
-        if not self.last_name:
-            raise ValueError("Last name is required")
-        
-        if not self.email:
-            raise ValueError("Email is required")
-        
-        # Validate email format
-        try:
-            validate_email(self.email)
-        except EmailNotValidError:
-            raise ValueError("Invalid email format")
-        
-        if not self.phone_number:
-            raise ValueError("Phone number is required")
-        
-        if not self.message:
-            raise ValueError("Message is required")
+    updated_at: Optional[datetime] = None
+    version: int = 0
+    archived: bool = False
+    spam: bool = False
@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from datetime import datetime
+
+
+@dataclass
+class LeadInDB:
+    """One prospect: every submission from the same normalized email, rolled up"""
+    email: str
+    first_name: str
+    last_name: str
+    phone_number: str
+    latest_message: str
+    latest_contact_id: str
+    submission_count: int
+    services: List[str] = field(default_factory=list)
+    first_seen: Optional[datetime] = None
+    last_seen: Optional[datetime] = None
@@ -0,0 +1,112 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from pymongo import DeleteOne, ReplaceOne
+from pymongo.errors import CollectionInvalid, OperationFailure
+
+from app.core.config import settings
+from app.core.lifecycle import lifecycle
+from app.database.mongodb import get_db, try_acquire_lease
+from app.services.contact_service import invalidate_contact
+from app.services.count_service import invalidate_counts
+from app.services.lead_service import refresh_leads
+
+ARCHIVE_COLLECTION = "contacts_archive"
+_JOB = "archive-contacts"
+_BATCH_SORT = [("created_at", 1), ("_id", 1)]
+
+
+async def ensure_archive_collection() -> None:
+    """
+    Create the archive with zstd block compression. Storage options can only
+    be set at creation, so an existing collection is left as it is.
+    """
+    db = get_db()
+    if ARCHIVE_COLLECTION not in await db.list_collection_names():
+        try:
+            await db.create_collection(
+                ARCHIVE_COLLECTION,
+                storageEngine={"wiredTiger": {"configString": "block_compressor=zstd"}},
+            )
+        except CollectionInvalid:
+            pass  # another worker created it first
+        except OperationFailure as e:
+            # e.g. a server built without zstd; fall back to the default compressor
+            print(f"⚠️ Creating {ARCHIVE_COLLECTION} with zstd failed ({e}); using defaults")
+            await db.create_collection(ARCHIVE_COLLECTION)
+    # Only what the include_archived listing sorts by; archived rows are read rarely
+    await db[ARCHIVE_COLLECTION].create_index([("created_at", -1), ("_id", -1)])
+
+
+async def _archive_batch(docs: List[Dict[str, Any]]) -> int:
+    """Copy a batch to the archive, then delete the originals that did not change meanwhile."""
+    db = get_db()
+    now = datetime.utcnow()
+    # Replacing by _id makes a retried batch (after a crash or a lost race) harmless
+    await db[ARCHIVE_COLLECTION].bulk_write(
+        [ReplaceOne({"_id": doc["_id"]}, {**doc, "archived_at": now}, upsert=True) for doc in docs],
+        ordered=False,
+    )
+    # Only delete the version we copied; an edit made in between keeps the live row
+    result = await db["contacts"].bulk_write(
+        [DeleteOne({"_id": doc["_id"], "version": doc.get("version")}) for doc in docs],
+        ordered=False,
+    )
+    ids = [doc["_id"] for doc in docs]
+    kept: List[Any] = []
+    if result.deleted_count < len(docs):
+        # Drop the stale copies of rows that were edited; a later run archives them again
+        kept = await db["contacts"].distinct("_id", {"_id": {"$in": ids}})
+        if kept:
+            await db[ARCHIVE_COLLECTION].delete_many({"_id": {"$in": kept}})
+    for doc_id in ids:
+        invalidate_contact(str(doc_id))
+    invalidate_counts(ARCHIVE_COLLECTION)
+    # Leads summarise live contacts; rebuild the ones that just lost rows
+    await refresh_leads(doc.get("email_normalized") for doc in docs if doc["_id"] not in kept)
+    return result.deleted_count
+
+
+async def archive_old_contacts() -> None:
+    """
+    Move contacts older than ``archive_after_days`` into the archive, a batch
+    at a time with a pause in between. Progress is checkpointed in
+    ``job_checkpoints`` so a restart resumes instead of rescanning; a pass
+    that reaches the end clears the checkpoint for the next one.
+    """
+    if settings.archive_after_days <= 0:
+        return
+    # One worker per interval does the work; the lease lapses before the next tick
+    if not await try_acquire_lease(_JOB, ttl_seconds=settings.archive_interval_seconds * 0.9):
+        return
+
+    db = get_db()
+    cutoff = datetime.utcnow() - timedelta(days=settings.archive_after_days)
+    checkpoint = await db["job_checkpoints"].find_one({"_id": _JOB}) or {}
+    archived = 0
+
+    while lifecycle.accepting:
+        query: Dict[str, Any] = {"created_at": {"$lt": cutoff}}
+        if checkpoint.get("created_at"):
+            query = {"$and": [query, {"$or": [
+                {"created_at": {"$gt": checkpoint["created_at"]}},
+                {"created_at": checkpoint["created_at"], "_id": {"$gt": checkpoint["last_id"]}},
+            ]}]}
+        docs = await (
+            db["contacts"].find(query).sort(_BATCH_SORT)
+            .limit(settings.archive_batch_size).to_list(settings.archive_batch_size)
+        )
+        if not docs:
+            await db["job_checkpoints"].delete_one({"_id": _JOB})
+            break
+
+        archived += await _archive_batch(docs)
+        checkpoint = {"created_at": docs[-1]["created_at"], "last_id": docs[-1]["_id"]}
+        await db["job_checkpoints"].update_one(
+            {"_id": _JOB}, {"$set": checkpoint}, upsert=True
+        )
+        await asyncio.sleep(settings.archive_batch_pause_seconds)
+
+    if archived:
+        print(f"📦 Archived {archived} contacts older than {cutoff:%Y-%m-%d}")
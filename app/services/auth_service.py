@@ -0,0 +1,131 @@
+import hashlib
+import hmac
+import secrets
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set
+
+from app.core.config import settings
+from app.database.mongodb import get_db
+from app.utils.cache import TTLCache
+from app.utils.tokens import HS256Signer, TokenError
+
+# token -> verified claims; repeat requests with the same token skip the HMAC
+_verified_claims = TTLCache(maxsize=settings.auth_token_cache_size, ttl=60.0)
+
+# jti values of revoked access tokens, mirrored from Mongo by refresh_revocations()
+_revoked_jtis: Set[str] = set()
+
+
+@lru_cache(maxsize=1)
+def get_signer() -> HS256Signer:
+    """Key material is derived once per process."""
+    secret = settings.jwt_secret
+    if not secret:
+        if settings.app_env == "production":
+            # Each worker would sign with its own key and reject the others' tokens
+            raise RuntimeError("JWT_SECRET must be set when APP_ENV=production")
+        # Tokens won't survive a restart or work across workers; fine for local dev only
+        print("⚠️ JWT_SECRET is not set; using a random per-process key.")
+        secret = secrets.token_urlsafe(32)
+    keys = [secret.encode("utf-8")]
+    if settings.jwt_previous_secret:
+        keys.append(settings.jwt_previous_secret.encode("utf-8"))
+    return HS256Signer(keys)
+
+
+def _hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def check_admin_credentials(email: str, password: str) -> bool:
+    if not settings.admin_email or not settings.admin_password:
+        return False
+    # compare_digest only accepts ASCII str, so compare the UTF-8 bytes
+    email_ok = hmac.compare_digest(
+        email.strip().lower().encode("utf-8"), settings.admin_email.lower().encode("utf-8")
+    )
+    password_ok = hmac.compare_digest(
+        password.encode("utf-8"), settings.admin_password.encode("utf-8")
+    )
+    return email_ok and password_ok
+
+
+def create_access_token(subject: str, role: str = "admin") -> Dict[str, Any]:
+    now = int(time.time())
+    claims = {
+        "sub": subject,
+        "role": role,
+        "type": "access",
+        "jti": secrets.token_hex(16),
+        "iat": now,
+        "exp": now + settings.access_token_ttl_seconds,
+    }
+    return {"token": get_signer().encode(claims), "claims": claims}
+
+
+def verify_access_token(token: str) -> Dict[str, Any]:
+    """Return the token's claims or raise TokenError. No database access."""
+    claims = _verified_claims.get(token)
+    if claims is None:
+        claims = get_signer().decode(token)
+        if claims.get("type") != "access":
+            raise TokenError("Not an access token")
+        _verified_claims.set(
+            token, claims, ttl=min(60.0, max(0.0, claims["exp"] - time.time()))
+        )
+    elif claims["exp"] < time.time():
+        raise TokenError("Token expired")
+    if claims["jti"] in _revoked_jtis:
+        raise TokenError("Token revoked")
+    return claims
+
+
+async def issue_tokens(subject: str, role: str = "admin") -> Dict[str, Any]:
+    access = create_access_token(subject, role)
+    refresh_token = secrets.token_urlsafe(32)
+    await get_db()["refresh_tokens"].insert_one({
+        "_id": _hash_refresh_token(refresh_token),
+        "sub": subject,
+        "role": role,
+        "expires_at": datetime.utcnow() + timedelta(seconds=settings.refresh_token_ttl_seconds),
+    })
+    return {
+        "access_token": access["token"],
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+        "expires_in": settings.access_token_ttl_seconds,
+    }
+
+
+async def rotate_refresh_token(refresh_token: str) -> Optional[Dict[str, Any]]:
+    """Exchange a refresh token for a new pair; the old one is consumed. None if invalid."""
+    doc = await get_db()["refresh_tokens"].find_one_and_delete(
+        {"_id": _hash_refresh_token(refresh_token), "expires_at": {"$gt": datetime.utcnow()}}
+    )
+    if doc is None:
+        return None
+    return await issue_tokens(doc["sub"], doc.get("role", "admin"))
+
+
+async def revoke(claims: Dict[str, Any], refresh_token: Optional[str] = None) -> None:
+    """Revoke an access token (until it would have expired) and its refresh token."""
+    db = get_db()
+    _revoked_jtis.add(claims["jti"])
+    await db["revoked_tokens"].update_one(
+        {"_id": claims["jti"]},
+        {"$set": {"expires_at": datetime.utcfromtimestamp(claims["exp"])}},
+        upsert=True,
+    )
+    if refresh_token:
+        await db["refresh_tokens"].delete_one({"_id": _hash_refresh_token(refresh_token)})
+
+
+async def refresh_revocations() -> None:
+    """Reload the revoked-jti set from Mongo (run periodically in the background)."""
+    global _revoked_jtis
+    cursor = get_db()["revoked_tokens"].find(
+        {"expires_at": {"$gt": datetime.utcnow()}}, {"_id": 1}
+    )
+    _revoked_jtis = {doc["_id"] async for doc in cursor}
@@ -1,13 +1,195 @@
+import calendar
+import hashlib
+import re
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
 from app.database.mongodb import get_db
 from app.schemas.contact import ContactCreate
+from app.services.count_service import invalidate_counts
+from app.services.email_validation_service import normalize_email
+from app.services.lead_service import record_submission
+from app.services.spam_service import score_submission
+from app.utils.cache import TTLCache
+
+_WHITESPACE = re.compile(r"\s+")
+_NON_DIGITS = re.compile(r"\D")
+
+# content hash -> id of the first copy, for rejecting double-clicks before Mongo
+_recent_fingerprints = TTLCache(
+    maxsize=settings.duplicate_cache_size,
+    ttl=settings.duplicate_window_seconds,
+)
+
+# contact id -> document, for the admin detail view
+_contact_docs = TTLCache(
+    maxsize=settings.contact_cache_size,
+    ttl=settings.contact_cache_ttl_seconds,
+)
+# Bumped on every invalidation so a read that raced a write does not cache the old copy
+_invalidations = 0
+
+
+@dataclass
+class SavedContact:
+    id: str
+    duplicate: bool = False
+    spam: bool = False
+
+
+def _content_hash(email_normalized: str, phone_number: str, message: str) -> str:
+    phone = _NON_DIGITS.sub("", phone_number)
+    text = _WHITESPACE.sub(" ", message).strip().lower()
+    raw = f"{email_normalized}\x1f{phone}\x1f{text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
 
-async def save_contact(data: ContactCreate) -> str:
+def compute_fingerprint(content_hash: str, created_at: datetime) -> str:
+    """Content hash plus the time bucket the submission falls in."""
+    # created_at is naive UTC; .timestamp() would read it as host-local time
+    bucket = calendar.timegm(created_at.utctimetuple()) // settings.duplicate_window_seconds
+    return f"{content_hash}:{bucket}"
+
+
+def fingerprint_for(email_normalized: str, phone_number: str, message: str,
+                    created_at: datetime) -> str:
+    """The fingerprint save_contact stores, for backfilling rows written before it."""
+    return compute_fingerprint(
+        _content_hash(email_normalized, phone_number, message), created_at
+    )
+
+
+async def save_contact(data: ContactCreate) -> SavedContact:
     """
-    Persist a contact in MongoDB and return the inserted id as a string.
+    Persist a contact in MongoDB and return its id.
+
+    Re-submissions of the same email/phone/message within the duplicate
+    window are not stored again; the id of the original is returned instead.
     """
-    db = get_db()
-    payload = data.dict()
+    payload: Dict[str, Any] = data.dict()
+    payload["email_normalized"] = normalize_email(data.email)  # exact-match lookups
     payload["created_at"] = datetime.utcnow()  # ✅ Add timestamp
-    result = await db["contacts"].insert_one(payload)
-    return str(result.inserted_id)
+    payload["updated_at"] = payload["created_at"]
+    payload["version"] = 1  # bumped on every update; exposed as the ETag
+
+    content_hash = _content_hash(
+        payload["email_normalized"], data.phone_number, data.message
+    )
+    original_id = _recent_fingerprints.get(content_hash)
+    if original_id is not None:
+        if await _still_stored(original_id, content_hash):
+            return SavedContact(id=original_id, duplicate=True)
+        # Deleted, archived or edited, possibly via another worker
+        _recent_fingerprints.pop(content_hash)
+
+    payload["fingerprint"] = compute_fingerprint(content_hash, payload["created_at"])
+
+    # Spam is kept (flagged) so it can be reviewed, but never mailed or counted as a lead
+    verdict = await score_submission(payload, honeypot=data.website)
+    if verdict.is_spam:
+        payload["spam"] = True
+        payload["spam_score"] = verdict.score
+        payload["spam_reasons"] = verdict.reasons
+
+    db = get_db()
+    try:
+        result = await db["contacts"].insert_one(payload)
+    except DuplicateKeyError:
+        # Another worker (or a restart) already stored this submission
+        original = await db["contacts"].find_one(
+            {"fingerprint": payload["fingerprint"]}, {"_id": 1}
+        )
+        if original is None:
+            raise
+        inserted_id = str(original["_id"])
+        _recent_fingerprints.set(content_hash, inserted_id)
+        return SavedContact(id=inserted_id, duplicate=True)
+
+    inserted_id = str(result.inserted_id)
+    _recent_fingerprints.set(content_hash, inserted_id)
+    invalidate_counts("contacts")
+    if verdict.is_spam:
+        print(f"🚫 Contact {inserted_id} flagged as spam ({', '.join(verdict.reasons)})")
+        return SavedContact(id=inserted_id, spam=True)
+    try:
+        await record_submission(payload, inserted_id)
+    except Exception as e:
+        # The contact is stored; a stale lead summary is not worth failing the form over
+        print(f"⚠️ Could not update lead for contact {inserted_id}: {e}")
+    return SavedContact(id=inserted_id)
+
+
+async def _still_stored(contact_id: str, content_hash: str) -> bool:
+    """
+    Whether the cached original still exists with the same content. The cache
+    is per worker, so a delete or edit handled elsewhere cannot evict it; a
+    primary-key lookup on the (rare) duplicate path keeps it honest.
+    """
+    return bool(await get_db()["contacts"].count_documents(
+        {"_id": ObjectId(contact_id), "fingerprint": {"$regex": f"^{content_hash}:"}},
+        limit=1,
+    ))
+
+
+def forget_fingerprint(fingerprint: str) -> None:
+    """Drop a deleted contact from the recent-submission cache so it can be re-sent."""
+    _recent_fingerprints.pop(fingerprint.split(":", 1)[0])
+
+
+async def refresh_fingerprint(doc: Dict[str, Any]) -> None:
+    """
+    Recompute the fingerprint of an updated contact from its new content,
+    keeping the time bucket of its original submission. ``doc`` is the
+    document as written; the update is skipped if the content has changed
+    again since, as that writer refreshes it in turn.
+    """
+    if not doc.get("email_normalized") or not doc.get("created_at"):
+        return  # legacy row the migrations have not reached yet
+    fingerprint = fingerprint_for(
+        doc["email_normalized"], doc.get("phone_number") or "",
+        doc.get("message") or "", doc["created_at"],
+    )
+    old = doc.get("fingerprint")
+    if fingerprint == old:
+        return
+    same_content = {
+        "_id": doc["_id"],
+        "email_normalized": doc["email_normalized"],
+        "phone_number": doc.get("phone_number"),
+        "message": doc.get("message"),
+    }
+    try:
+        await get_db()["contacts"].update_one(same_content, {"$set": {"fingerprint": fingerprint}})
+    except DuplicateKeyError:
+        # Now identical to another submission in the same window; like legacy
+        # duplicates it simply goes without one
+        await get_db()["contacts"].update_one(same_content, {"$unset": {"fingerprint": ""}})
+    if old:
+        forget_fingerprint(old)
+
+
+async def get_contact(object_id: ObjectId) -> Optional[Dict[str, Any]]:
+    """Fetch one contact document, from the cache when it is hot."""
+    key = str(object_id)
+    doc = _contact_docs.get(key)
+    if doc is not None:
+        return doc
+
+    generation = _invalidations
+    doc = await get_db()["contacts"].find_one({"_id": object_id})
+    if doc is not None and generation == _invalidations:
+        _contact_docs.set(key, doc)
+    return doc
+
+
+def invalidate_contact(contact_id: str) -> None:
+    """Call after any write to a contact so the next read goes to Mongo."""
+    global _invalidations
+    _invalidations += 1
+    _contact_docs.pop(contact_id)
+    invalidate_counts("contacts")
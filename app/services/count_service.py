@@ -0,0 +1,67 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.lifecycle import lifecycle
+from app.database.mongodb import get_db
+from app.utils.cache import TTLCache
+
+# (collection, generation, filter) -> exact count
+_counts = TTLCache(maxsize=settings.count_cache_size, ttl=settings.count_cache_ttl_seconds)
+# Bumping a collection's generation orphans its cached counts; LRU evicts them
+_generations: Dict[str, int] = {}
+# Counts being computed, so concurrent requests for the same filter share one scan
+_pending: Dict[tuple, asyncio.Task] = {}
+
+
+def _cache_key(collection: str, query: Dict[str, Any]) -> tuple:
+    canonical = json.dumps(query, sort_keys=True, default=str)
+    return collection, _generations.get(collection, 0), canonical
+
+
+async def _count(key: tuple, collection: str, query: Dict[str, Any]) -> int:
+    try:
+        total = await get_db()[collection].count_documents(query)
+        if key[1] == _generations.get(collection, 0):
+            _counts.set(key, total)
+        return total
+    finally:
+        _pending.pop(key, None)
+
+
+async def total_count(collection: str, query: Dict[str, Any]) -> Optional[int]:
+    """
+    Total for a list view, or None when it is not known yet.
+
+    Unfiltered totals come from collection metadata. Filtered totals are
+    exact counts cached for a few seconds; a miss starts the count in the
+    background and waits at most ``count_wait_budget_ms`` for it, so a slow
+    count only ever costs that much latency and the next request gets it.
+    """
+    if not query:
+        return await get_db()[collection].estimated_document_count()
+
+    key = _cache_key(collection, query)
+    cached = _counts.get(key)
+    if cached is not None:
+        return cached
+
+    task = _pending.get(key)
+    if task is None:
+        task = lifecycle.spawn(_count(key, collection, query), name=f"count:{collection}")
+        _pending[key] = task
+    try:
+        return await asyncio.wait_for(
+            asyncio.shield(task), settings.count_wait_budget_ms / 1000
+        )
+    except asyncio.TimeoutError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Count on {collection} failed: {e}")
+        return None
+
+
+def invalidate_counts(collection: str) -> None:
+    """Call after writes to ``collection`` so filtered totals are recomputed."""
+    _generations[collection] = _generations.get(collection, 0) + 1
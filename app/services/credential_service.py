@@ -0,0 +1,98 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+
+from app.core.config import settings
+
+# bcrypt releases the GIL, so a few threads hash in parallel while the event
+# loop keeps serving contact submissions. The semaphore bounds how much work
+# can pile up behind them during a login burst.
+_executor: Optional[ThreadPoolExecutor] = None
+_slots: Optional[asyncio.Semaphore] = None
+
+BCRYPT_MAX_BYTES = 72
+
+
+class CredentialServiceBusy(Exception):
+    """Too many hash operations are already queued."""
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers, thread_name_prefix="password-hash"
+        )
+    return _executor
+
+
+async def _run(fn, *args):
+    global _slots
+    if _slots is None:
+        _slots = asyncio.Semaphore(settings.password_hash_max_pending)
+    if _slots.locked():
+        raise CredentialServiceBusy("Too many concurrent password operations")
+    async with _slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), fn, *args)
+
+
+def _hash_sync(password: bytes, rounds: int) -> str:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds)).decode("ascii")
+
+
+def _verify_sync(password: bytes, hashed: bytes) -> bool:
+    try:
+        return bcrypt.checkpw(password, hashed)
+    except ValueError:  # malformed hash
+        return False
+
+
+def _encode(password: str) -> bytes:
+    encoded = password.encode("utf-8")
+    if len(encoded) > BCRYPT_MAX_BYTES:
+        raise ValueError(f"Password must be at most {BCRYPT_MAX_BYTES} bytes")
+    return encoded
+
+
+async def hash_password(password: str) -> str:
+    return await _run(_hash_sync, _encode(password), settings.bcrypt_rounds)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    try:
+        encoded = _encode(password)
+    except ValueError:
+        return False
+    return await _run(_verify_sync, encoded, hashed.encode("ascii"))
+
+
+def needs_rehash(hashed: str) -> bool:
+    """True if the hash was made with a different work factor than the configured one."""
+    try:
+        rounds = int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.bcrypt_rounds
+
+
+# Verified against when the user doesn't exist, so response time doesn't reveal it.
+# Must use the same work factor as real hashes; built on first use so importing
+# this module doesn't pay for a full-cost hash, and rebuilt if the cost changes.
+_dummy_hash: Optional[str] = None
+
+
+async def verify_dummy() -> None:
+    global _dummy_hash
+    if _dummy_hash is None or needs_rehash(_dummy_hash):
+        _dummy_hash = await _run(_hash_sync, b"dummy-password", settings.bcrypt_rounds)
+    await verify_password("not-the-password", _dummy_hash)
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
@@ -0,0 +1,39 @@
+from functools import lru_cache
+from typing import Optional
+from email_validator import validate_email, EmailNotValidError
+
+from app.core.config import settings
+
+
+def _cache_key(address: str) -> str:
+    """Cheap pre-normalization so "John@X.com " and "john@x.com" share a cache slot."""
+    return address.strip().lower()
+
+
+@lru_cache(maxsize=settings.email_validation_cache_size)
+def _validate_normalized(key: str) -> Optional[str]:
+    """
+    Syntax-only validation (no DNS / deliverability lookups).
+    Returns the normalized address, or None when it is invalid, so bad
+    addresses are cached too and repeated spam doesn't re-run the parser.
+    """
+    try:
+        info = validate_email(key, check_deliverability=False)
+    except EmailNotValidError:
+        return None
+    return info.normalized.lower()
+
+
+def normalize_email(address: str) -> str:
+    """
+    Validate an email address and return its normalized (lower-cased) form.
+    Raises ValueError if the address is not syntactically valid.
+    """
+    normalized = _validate_normalized(_cache_key(address))
+    if normalized is None:
+        raise ValueError("Invalid email format")
+    return normalized
+
+
+def cache_info():
+    return _validate_normalized.cache_info()
@@ -0,0 +1,64 @@
+import asyncio
+import time
+from typing import Any, Dict
+
+from app.core.config import settings
+from app.core.lifecycle import lifecycle
+from app.database import mongodb
+from app.dependencies.rate_limit import write_admission
+from app.services.notification_service import notification_service, smtp_breaker
+from app.utils.json_encoding import dumps
+
+
+class HealthMonitor:
+    """
+    Probes dependencies in the background and keeps the last result as
+    ready-to-send JSON, so /readyz answers from memory no matter how often a
+    load balancer polls it. A result older than a few intervals counts as
+    not ready: it means the probe loop itself is stuck.
+    """
+
+    def __init__(self, interval: float, timeout: float):
+        self.interval = interval
+        self.timeout = timeout
+        self.ready = False
+        self.body = dumps({"status": "starting"})
+        self._checked_at = 0.0
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() - self._checked_at < self.interval * 3
+
+    async def _probe_mongo(self) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(mongodb.client.admin.command("ping"), self.timeout)
+        except Exception as e:
+            return {"ok": False, "error": str(e) or type(e).__name__}
+        return {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 2)}
+
+    async def refresh(self) -> None:
+        mongo = await self._probe_mongo() if mongodb.client is not None else {"ok": False}
+        mongo["pool"] = mongodb.pool_stats.as_dict()
+        try:
+            outbox = await asyncio.wait_for(notification_service.pending(), self.timeout)
+        except Exception:
+            outbox = None  # Mongo is down; already reported above
+        self.ready = mongo["ok"]
+        self._checked_at = time.monotonic()
+        self.body = dumps({
+            "status": "ready" if self.ready else "unavailable",
+            "mongo": mongo,
+            # SMTP failures only delay mail (it queues), so they don't fail readiness
+            "smtp": {"breaker": smtp_breaker.state},
+            "queues": {
+                "notifications": outbox,
+                "contact_writes_in_flight": write_admission.in_flight,
+                "background_tasks": lifecycle.pending_tasks,
+            },
+        })
+
+
+health_monitor = HealthMonitor(
+    interval=settings.health_probe_interval, timeout=settings.health_probe_timeout
+)
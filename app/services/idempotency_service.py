@@ -0,0 +1,199 @@
+import hashlib
+import json
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.database.mongodb import get_db
+from app.utils.cache import TTLCache
+
+MAX_KEY_LENGTH = 255
+
+_PENDING = "pending"
+_DONE = "done"
+
+# Completed responses are served from here first; Mongo backs it across restarts and workers
+_responses = TTLCache(
+    maxsize=settings.idempotency_cache_size,
+    ttl=settings.idempotency_ttl_seconds,
+)
+
+
+class IdempotencyKeyReused(Exception):
+    """The key was already used for a request with a different body."""
+
+
+class IdempotencyKeyInProgress(Exception):
+    """The first request with this key has not finished yet."""
+
+
+class InvalidIdempotencyKey(ValueError):
+    """The Idempotency-Key header is empty or too long."""
+
+
+@dataclass
+class IdempotentCall:
+    """
+    Yielded by ``idempotent``. ``replay`` is the stored {"status_code", "body"}
+    to send instead of doing the work; otherwise do it and ``complete`` it.
+    """
+    replay: Optional[Dict[str, Any]] = None
+    status_code: Optional[int] = None
+    body: Optional[Dict[str, Any]] = None
+
+    def complete(self, status_code: int, body: Dict[str, Any]) -> None:
+        self.status_code = status_code
+        self.body = body
+
+
+def _storage_key(scope: str, key: str) -> str:
+    return f"{scope}:{key}"
+
+
+def validate_key(key: str) -> str:
+    key = key.strip()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise InvalidIdempotencyKey(f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")
+    return key
+
+
+def request_hash(payload: Dict[str, Any]) -> str:
+    """Fingerprint of a request body, so a key only ever replays for the same request."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _completed(doc: Dict[str, Any], body_hash: str) -> Optional[Dict[str, Any]]:
+    if doc["request_hash"] != body_hash:
+        raise IdempotencyKeyReused()
+    if doc.get("state") != _DONE:
+        return None
+    return {"status_code": doc["status_code"], "body": doc["body"], "request_hash": doc["request_hash"]}
+
+
+async def get_stored_response(scope: str, key: str, body_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Read-only check: the stored {"status_code", "body"} for a completed key,
+    or None if the key is new. Raises IdempotencyKeyReused for a different
+    body and IdempotencyKeyInProgress while the first request is running.
+    """
+    storage_key = _storage_key(scope, key)
+    stored = _responses.get(storage_key)
+    if stored is not None:
+        return _completed({**stored, "state": _DONE}, body_hash)
+
+    doc = await get_db()["idempotency_keys"].find_one({"_id": storage_key})
+    if doc is None:
+        return None
+    stored = _completed(doc, body_hash)
+    if stored is None:
+        raise IdempotencyKeyInProgress()
+    _responses.set(storage_key, stored)
+    return stored
+
+
+async def reserve(scope: str, key: str, body_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Claim the key before doing the work. Returns None when the caller owns it
+    and must finish with store_response (or release on failure); returns the
+    stored response if another request completed it first.
+    """
+    storage_key = _storage_key(scope, key)
+    collection = get_db()["idempotency_keys"]
+    now = datetime.utcnow()
+    try:
+        await collection.insert_one(
+            {"_id": storage_key, "state": _PENDING, "request_hash": body_hash, "created_at": now}
+        )
+        return None
+    except DuplicateKeyError:
+        pass
+
+    # A pending marker left by a crashed worker is taken over once it is stale
+    taken = await collection.find_one_and_update(
+        {
+            "_id": storage_key,
+            "state": _PENDING,
+            "request_hash": body_hash,
+            "created_at": {"$lt": now - timedelta(seconds=settings.idempotency_pending_timeout)},
+        },
+        {"$set": {"created_at": now}},
+    )
+    if taken is not None:
+        return None
+    return await get_stored_response(scope, key, body_hash)
+
+
+async def store_response(scope: str, key: str, body_hash: str,
+                         status_code: int, body: Dict[str, Any]) -> None:
+    """Complete a reserved key; the cache always mirrors what Mongo ends up holding."""
+    storage_key = _storage_key(scope, key)
+    doc = await get_db()["idempotency_keys"].find_one_and_update(
+        {"_id": storage_key, "state": _PENDING, "request_hash": body_hash},
+        {"$set": {"state": _DONE, "status_code": status_code, "body": body}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if doc is None:
+        # Our reservation was taken over or expired; keep whatever was stored instead
+        doc = await get_db()["idempotency_keys"].find_one({"_id": storage_key})
+    if doc is not None and doc.get("state") == _DONE:
+        _responses.set(storage_key, {
+            "status_code": doc["status_code"], "body": doc["body"], "request_hash": doc["request_hash"],
+        })
+
+
+async def release(scope: str, key: str, body_hash: str) -> None:
+    """Drop our reservation after a failure so the client's retry can run."""
+    await get_db()["idempotency_keys"].delete_one(
+        {"_id": _storage_key(scope, key), "state": _PENDING, "request_hash": body_hash}
+    )
+
+
+@asynccontextmanager
+async def idempotent(scope: str, key: Optional[str], payload: Dict[str, Any],
+                     guard: Optional[AsyncContextManager] = None) -> AsyncIterator[IdempotentCall]:
+    """
+    Run one request under an optional Idempotency-Key:
+
+    1. a stored response for the key is replayed straight away, before
+       ``guard`` (rate limits, admission), so retries are never throttled;
+    2. otherwise ``guard`` is entered and the key reserved; a request that
+       completed it meanwhile is replayed instead;
+    3. the caller does the work and calls ``complete``; the response is
+       stored, or the reservation released if it failed or never completed.
+
+    Raises InvalidIdempotencyKey, IdempotencyKeyReused (same key, other
+    body) or IdempotencyKeyInProgress.
+    """
+    call = IdempotentCall()
+    if key is None:
+        async with guard or nullcontext():
+            yield call
+        return
+
+    key = validate_key(key)
+    body_hash = request_hash(payload)
+    call.replay = await get_stored_response(scope, key, body_hash)
+    if call.replay is not None:
+        yield call
+        return
+
+    async with guard or nullcontext():
+        call.replay = await reserve(scope, key, body_hash)
+        if call.replay is not None:
+            yield call
+            return
+        try:
+            yield call
+        except BaseException:
+            await release(scope, key, body_hash)
+            raise
+        if call.body is None:
+            await release(scope, key, body_hash)
+        else:
+            await store_response(scope, key, body_hash, call.status_code, call.body)
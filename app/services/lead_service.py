@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.database.mongodb import get_db
+from app.utils.pagination import keyset_after
+
+# leads documents: one per normalized email, _id is the address itself
+_LIST_SORT = [("last_seen", -1), ("_id", -1)]
+
+
+async def record_submission(contact: Dict[str, Any], contact_id: str) -> None:
+    """
+    Fold a newly stored contact into its lead. Called on the insert path only,
+    so duplicates are never counted and the dashboard never has to $group.
+    """
+    created_at: datetime = contact["created_at"]
+    await get_db()["leads"].update_one(
+        {"_id": contact["email_normalized"]},
+        {
+            "$inc": {"submission_count": 1},
+            "$min": {"first_seen": created_at},
+            "$max": {"last_seen": created_at},
+            "$set": {
+                "email": contact["email"],
+                "first_name": contact["first_name"],
+                "last_name": contact["last_name"],
+                "phone_number": contact["phone_number"],
+                "latest_message": contact["message"],
+                "latest_contact_id": contact_id,
+            },
+            "$addToSet": {"services": {"$each": contact.get("services") or []}},
+        },
+        upsert=True,
+    )
+
+
+async def rebuild_lead(email_normalized: str) -> None:
+    """
+    Recompute one lead from the live, non-spam contacts behind it, or drop it
+    when none are left. Used wherever contacts disappear (delete, archive) so
+    ``latest_contact_id`` never points at a row that is gone.
+    """
+    db = get_db()
+    docs = await (
+        db["contacts"]
+        .find({"email_normalized": email_normalized, "spam": {"$ne": True}})
+        .sort([("created_at", 1), ("_id", 1)])
+        .to_list(None)
+    )
+    if not docs:
+        await db["leads"].delete_one({"_id": email_normalized})
+        return
+    latest = docs[-1]
+    services: List[str] = []
+    for doc in docs:
+        services.extend(s for s in doc.get("services") or [] if s not in services)
+    await db["leads"].replace_one(
+        {"_id": email_normalized},
+        {
+            "submission_count": len(docs),
+            "first_seen": docs[0]["created_at"],
+            "last_seen": latest["created_at"],
+            "email": latest["email"],
+            "first_name": latest["first_name"],
+            "last_name": latest["last_name"],
+            "phone_number": latest["phone_number"],
+            "latest_message": latest["message"],
+            "latest_contact_id": str(latest["_id"]),
+            "services": services,
+        },
+        upsert=True,
+    )
+
+
+async def refresh_leads(emails: Iterable[Optional[str]]) -> None:
+    """Rebuild the leads for ``emails``; failures are logged, never raised to the caller."""
+    for email in {e for e in emails if e}:
+        try:
+            await rebuild_lead(email)
+        except Exception as e:
+            print(f"⚠️ Failed to refresh lead {email}: {e}")
+
+
+async def list_leads(limit: int, after: Optional[tuple] = None) -> List[Dict[str, Any]]:
+    """Leads by most recent activity; ``after`` is the (last_seen, _id) of the previous page."""
+    query = keyset_after("last_seen", *after) if after else {}
+    cursor = get_db()["leads"].find(query).sort(_LIST_SORT).limit(limit)
+    return await cursor.to_list(limit)
@@ -0,0 +1,63 @@
+from typing import Dict, Iterable, List, Tuple
+
+from app.core.config import settings
+from app.database.mongodb import get_db
+
+# notification_rules documents: {"service": "SEO", "recipients": ["marketing@..."],
+# "enabled": true}. The service "*" matches every submission.
+ANY_SERVICE = "*"
+
+
+def _service_key(service: str) -> str:
+    return service.strip().casefold()
+
+
+class NotificationRouter:
+    """
+    Maps a submission's services to the inboxes that should hear about it.
+
+    Rules are held in memory as a dict keyed by service, so routing is one
+    lookup per service; ``reload`` rebuilds the dict from Mongo and swaps it
+    in whole, so a send never sees a half-loaded rule set. With no matching
+    rule the mail goes to ``fallback`` (NOTIFY_EMAIL), as before routing.
+    """
+
+    def __init__(self, fallback: Iterable[str] = ()):
+        self.fallback: Tuple[str, ...] = tuple(r for r in fallback if r)
+        self._rules: Dict[str, Tuple[str, ...]] = {}
+
+    def recipients_for(self, services: Iterable[str]) -> List[str]:
+        rules = self._rules
+        seen = set()
+        recipients: List[str] = []
+        for key in (*(_service_key(s) for s in services or ()), ANY_SERVICE):
+            for address in rules.get(key, ()):
+                folded = address.casefold()
+                if folded not in seen:
+                    seen.add(folded)
+                    recipients.append(address)
+        return recipients or list(self.fallback)
+
+    def load(self, rules: Iterable[dict]) -> None:
+        table: Dict[str, List[str]] = {}
+        for rule in rules:
+            if not rule.get("enabled", True) or not rule.get("service"):
+                continue
+            key = rule["service"] if rule["service"] == ANY_SERVICE else _service_key(rule["service"])
+            table.setdefault(key, []).extend(
+                address.strip() for address in rule.get("recipients", []) if address.strip()
+            )
+        self._rules = {key: tuple(addresses) for key, addresses in table.items()}
+
+    async def reload(self) -> None:
+        """Re-read notification_rules (run periodically, so edits apply without a restart)."""
+        docs = await get_db()["notification_rules"].find(
+            {}, {"_id": 0, "service": 1, "recipients": 1, "enabled": 1}
+        ).to_list(None)
+        previous = self._rules
+        self.load(docs)
+        if self._rules != previous:
+            print(f"📬 Loaded {len(docs)} notification routing rule(s)")
+
+
+notification_router = NotificationRouter(fallback=[settings.notify_email])
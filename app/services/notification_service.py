@@ -0,0 +1,223 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from pymongo import ReturnDocument
+
+from app.core.config import settings
+from app.database.mongodb import get_db
+from app.dependencies.email_provider import get_email_sender
+from app.services.notification_routing import NotificationRouter, notification_router
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.email_utils import EmailSender, SenderBusy
+
+# notify_contact() outcomes
+SENT = "sent"
+QUEUED = "queued"
+DISABLED = "disabled"
+
+OUTBOX_COLLECTION = "notification_outbox"
+# A claimed item is hidden from other workers this long; covers connect + send
+_CLAIM_SECONDS = 60
+_MAX_RETRY_DELAY = 300
+
+
+class NotificationService:
+    """
+    Sends contact notifications through a circuit breaker.
+
+    While SMTP is healthy mails go out inline. Once it starts failing the
+    breaker opens and new notifications go to the ``notification_outbox``
+    collection without touching SMTP at all; a background worker probes the
+    server (half-open) and drains the outbox once it recovers. The outbox is
+    in Mongo, so mail queued during an outage survives restarts and deploys,
+    and any worker can send what another one queued.
+
+    The sender comes from ``sender_factory`` on first use; if SMTP isn't
+    configured notifications are skipped and the rest of the app keeps working.
+    """
+
+    def __init__(self, sender_factory: Callable[[], Optional[EmailSender]],
+                 breaker: CircuitBreaker, poll_interval: float = 5.0,
+                 router: Optional[NotificationRouter] = None):
+        self._sender_factory = sender_factory
+        self.breaker = breaker
+        self.router = router
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def sender(self) -> Optional[EmailSender]:
+        return self._sender_factory()
+
+    async def notify_contact(self, data: Dict[str, Any]) -> str:
+        """Send now if the circuit allows it, otherwise queue. Returns SENT, QUEUED or DISABLED."""
+        sender = self.sender
+        if sender is None:
+            return DISABLED
+        if not self.breaker.allow_request():
+            await self._enqueue(data)
+            return QUEUED
+        try:
+            await self._send(sender, data)
+        except SenderBusy:
+            # Never reached SMTP: queue without counting it against the server
+            self.breaker.cancel_request()
+            await self._enqueue(data)
+            return QUEUED
+        except Exception as exc:
+            print(f"❌ Email sending failed, queued for retry: {exc}")
+            self.breaker.record_failure()
+            await self._enqueue(data)
+            return QUEUED
+        self.breaker.record_success()
+        return SENT
+
+    async def _send(self, sender: EmailSender, data: Dict[str, Any]) -> None:
+        # Routed at send time, so queued mail follows rules edited in the meantime
+        recipients = self.router.recipients_for(data.get("services") or []) if self.router else None
+        # Re-checked once the session is ours: an outage that opened the circuit
+        # while we waited must not cost another connect timeout
+        await sender.send_contact_email(
+            data, recipients=recipients,
+            proceed=lambda: self.breaker.state != CircuitBreaker.OPEN,
+        )
+
+    async def warm(self) -> None:
+        """Open the SMTP connection ahead of the first submission (run in the background)."""
+        sender = self.sender
+        if sender is None:
+            return
+        try:
+            await sender.warm()
+            print("📧 SMTP connection warmed.")
+        except Exception as exc:
+            print(f"⚠️ SMTP warm-up failed, will connect on first send: {exc}")
+
+    async def close_sender(self) -> None:
+        sender = self.sender
+        if sender is not None:
+            await sender.close()
+
+    async def pending(self) -> int:
+        """Notifications waiting in the outbox (all workers)."""
+        return await get_db()[OUTBOX_COLLECTION].count_documents({})
+
+    async def _enqueue(self, data: Dict[str, Any]) -> None:
+        now = datetime.utcnow()
+        try:
+            await get_db()[OUTBOX_COLLECTION].insert_one(
+                {"data": data, "created_at": now, "available_at": now, "attempts": 0}
+            )
+        except Exception as exc:
+            # The contact itself is stored; only its notification is lost
+            print(f"❌ Could not queue notification for {data.get('email')}: {exc}")
+            return
+        self._wakeup.set()
+
+    async def _claim(self) -> Optional[Dict[str, Any]]:
+        """Take the oldest due item; the claim lapses if this worker dies mid-send."""
+        now = datetime.utcnow()
+        return await get_db()[OUTBOX_COLLECTION].find_one_and_update(
+            {"available_at": {"$lte": now}},
+            {"$set": {"available_at": now + timedelta(seconds=_CLAIM_SECONDS)}},
+            sort=[("available_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _deliver_next(self) -> bool:
+        """Send one outbox item. False when nothing is due."""
+        item = await self._claim()
+        if item is None:
+            return False
+        outbox = get_db()[OUTBOX_COLLECTION]
+        try:
+            await self._send(self.sender, item["data"])
+        except SenderBusy:
+            self.breaker.cancel_request()
+            await outbox.update_one({"_id": item["_id"]}, {"$set": {"available_at": datetime.utcnow()}})
+        except Exception as exc:
+            print(f"❌ Queued email retry failed: {exc}")
+            self.breaker.record_failure()
+            # Back off per item too, so one undeliverable mail cannot spin the worker
+            delay = min(2 ** item["attempts"], _MAX_RETRY_DELAY)
+            await outbox.update_one(
+                {"_id": item["_id"]},
+                {"$set": {"available_at": datetime.utcnow() + timedelta(seconds=delay)},
+                 "$inc": {"attempts": 1}},
+            )
+        else:
+            self.breaker.record_success()
+            await outbox.delete_one({"_id": item["_id"]})
+        return True
+
+    async def _drain_forever(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                while not self.breaker.allow_request():
+                    await asyncio.sleep(max(self.breaker.retry_after(), 0.5))
+                if self.sender is not None and await self._deliver_next():
+                    continue
+                self.breaker.cancel_request()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                # Mongo trouble; the items stay in the outbox for the next pass
+                self.breaker.cancel_request()
+                print(f"⚠️ Notification outbox pass failed: {exc}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._worker is None or self._worker.done():
+            # Bind a fresh event to the running loop (matters when the app restarts in-process)
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.create_task(self._drain_forever())
+
+    async def drain(self, timeout: float) -> None:
+        """
+        Give the worker up to ``timeout`` seconds to empty the outbox. Whatever
+        is left stays in Mongo and goes out after the next start.
+        """
+        left = await self.pending()
+        if not left:
+            return
+        print(f"📨 Draining {left} queued notification(s)...")
+        self.start()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while left and loop.time() < deadline:
+            self._wakeup.set()
+            await asyncio.sleep(min(0.5, max(0.0, deadline - loop.time())))
+            left = await self.pending()
+        if left:
+            print(f"📨 {left} notification(s) kept in the outbox for the next start")
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+
+smtp_breaker = CircuitBreaker(
+    "smtp",
+    failure_threshold=settings.smtp_breaker_failure_threshold,
+    reset_timeout=settings.smtp_breaker_reset_timeout,
+)
+notification_service = NotificationService(
+    get_email_sender, smtp_breaker, poll_interval=settings.notification_poll_interval,
+    router=notification_router,
+)
+
+
+def get_notification_service() -> NotificationService:
+    """FastAPI dependency; override in tests with app.dependency_overrides."""
+    return notification_service
@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.utils import spam
+from app.utils.cache import TTLCache
+
+# Scoring is CPU-bound regex/model work, so it runs in worker processes rather
+# than on the event loop. Spawned, not forked: the parent has Motor threads.
+_executor: Optional[ProcessPoolExecutor] = None
+
+_WHITESPACE = re.compile(r"\s+")
+# message hash -> how many submissions carried it, across all senders
+_recent_messages = TTLCache(
+    maxsize=settings.duplicate_cache_size,
+    ttl=settings.duplicate_window_seconds,
+)
+
+
+@dataclass
+class SpamVerdict:
+    score: float = 0.0
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def is_spam(self) -> bool:
+        return self.score >= settings.spam_threshold
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.spam_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=spam.load_model,
+            initargs=(settings.spam_model_path,),
+        )
+    return _executor
+
+
+def _repeat_count(message: str) -> int:
+    text = _WHITESPACE.sub(" ", message).strip().lower()
+    key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    count = _recent_messages.get(key, 0) + 1
+    _recent_messages.set(key, count)
+    return count
+
+
+async def score_submission(payload: Dict[str, Any], honeypot: Optional[str] = None) -> SpamVerdict:
+    """
+    Score a submission before it is stored. Cheap signals (honeypot, the same
+    text from many senders) are checked here; the rest runs in the pool with
+    a timeout. If the pool is slow or broken the submission is let through,
+    so scoring can never take the contact form down.
+    """
+    if not settings.spam_enabled:
+        return SpamVerdict()
+    if honeypot:
+        return SpamVerdict(score=1.0, reasons=["honeypot"])
+
+    verdict = SpamVerdict()
+    if _repeat_count(payload.get("message") or "") >= 3:
+        verdict.score, verdict.reasons = 0.5, ["repeated_message"]
+
+    submission = dict(payload, _disposable_domains=settings.spam_disposable_domains)
+    loop = asyncio.get_running_loop()
+    try:
+        pool_score, pool_reasons = await asyncio.wait_for(
+            loop.run_in_executor(_get_executor(), spam.score, submission),
+            settings.spam_timeout_ms / 1000,
+        )
+    except asyncio.TimeoutError:
+        print("⚠️ Spam scoring timed out; accepting submission unscored")
+        return verdict
+    except Exception as e:
+        print(f"⚠️ Spam scoring failed ({e}); accepting submission unscored")
+        return verdict
+
+    verdict.score = min(verdict.score + pool_score, 1.0)
+    verdict.reasons += pool_reasons
+    return verdict
+
+
+async def warm() -> None:
+    """Start the worker processes at boot so the first submission doesn't pay for it."""
+    if not settings.spam_enabled:
+        return
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(_get_executor(), spam.score, {})
+    except Exception as e:
+        print(f"⚠️ Spam scorer failed to start: {e}")
+
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
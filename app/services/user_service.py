@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Optional
+
+from app.database.mongodb import get_db
+from app.models.user import UserInDB
+from app.services import credential_service
+from app.services.email_validation_service import normalize_email
+
+
+class InvalidPassword(Exception):
+    """The user exists but the password is wrong."""
+
+
+def _to_user(doc) -> UserInDB:
+    return UserInDB(
+        id=str(doc["_id"]),
+        email=doc["email"],
+        hashed_password=doc["hashed_password"],
+        role=doc.get("role", "user"),
+    )
+
+
+async def get_user_by_email(email: str) -> Optional[UserInDB]:
+    doc = await get_db()["users"].find_one({"email": normalize_email(email)})
+    return _to_user(doc) if doc else None
+
+
+async def create_user(email: str, password: str, role: str = "user") -> UserInDB:
+    doc = {
+        "email": normalize_email(email),
+        "hashed_password": await credential_service.hash_password(password),
+        "role": role,
+        "created_at": datetime.utcnow(),
+    }
+    result = await get_db()["users"].insert_one(doc)
+    doc["_id"] = result.inserted_id
+    return _to_user(doc)
+
+
+async def authenticate_user(email: str, password: str) -> Optional[UserInDB]:
+    """
+    Check a user's password. Returns None when there is no such user and
+    raises InvalidPassword when there is but the password is wrong, so
+    callers can tell the two apart. Hashes made with an outdated work factor
+    are upgraded transparently on successful login.
+    """
+    try:
+        user = await get_user_by_email(email)
+    except ValueError:  # not even a valid address
+        user = None
+    if user is None:
+        await credential_service.verify_dummy()
+        return None
+    if not await credential_service.verify_password(password, user.hashed_password):
+        raise InvalidPassword()
+    if credential_service.needs_rehash(user.hashed_password):
+        user.hashed_password = await credential_service.hash_password(password)
+        await get_db()["users"].update_one(
+            {"email": user.email}, {"$set": {"hashed_password": user.hashed_password}}
+        )
+    return user
@@ -0,0 +1,120 @@
+# app/utils/email_templates.py
+import html
+from dataclasses import dataclass
+from email import policy
+from email.headerregistry import HeaderRegistry
+from email.message import EmailMessage
+from pathlib import Path
+from string import Template
+from typing import Any, Callable, Dict, List, Tuple
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+
+class _CachedHeaderRegistry(HeaderRegistry):
+    """The stdlib registry builds a new header class with type() on every lookup; build each once."""
+
+    def __init__(self):
+        super().__init__()
+        self._classes: Dict[str, type] = {}
+
+    def __getitem__(self, name: str) -> type:
+        key = name.lower()
+        cls = self._classes.get(key)
+        if cls is None:
+            cls = self._classes[key] = super().__getitem__(name)
+        return cls
+
+
+_POLICY = policy.default.clone(header_factory=_CachedHeaderRegistry())
+
+
+def _escape_html(value: str) -> str:
+    return html.escape(value).replace("\n", "<br>\n")
+
+
+class CompiledTemplate:
+    """
+    A ``string.Template`` source parsed once into static text and slots.
+
+    Rendering copies the pre-built parts list, drops the escaped values into
+    the slots and joins, so the static markup is never re-scanned or copied
+    piecemeal per message the way ``Template.substitute`` does.
+    """
+
+    def __init__(self, source: str, escape: Callable[[str], str] = str):
+        self._escape = escape
+        self._parts: List[str] = []
+        self._slots: List[Tuple[int, str]] = []
+        literal: List[str] = []
+        position = 0
+        for match in Template.pattern.finditer(source):
+            literal.append(source[position:match.start()])
+            position = match.end()
+            if match.group("escaped") is not None:
+                literal.append("$")
+                continue
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                raise ValueError(f"Invalid placeholder in template: {match.group()!r}")
+            self._parts.append("".join(literal))
+            literal = []
+            self._slots.append((len(self._parts), name))
+            self._parts.append("")
+        literal.append(source[position:])
+        self._parts.append("".join(literal))
+
+    @property
+    def fields(self) -> frozenset:
+        return frozenset(name for _, name in self._slots)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        parts = self._parts.copy()
+        escape = self._escape
+        for index, name in self._slots:
+            parts[index] = escape(str(values[name]))
+        return "".join(parts)
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    """Subject plus plain-text and HTML bodies, sent as multipart/alternative."""
+    subject: CompiledTemplate
+    text: CompiledTemplate
+    html: CompiledTemplate
+
+    def render(self, values: Dict[str, Any]) -> EmailMessage:
+        """Build the message once; callers only add From/To before sending."""
+        message = EmailMessage(policy=_POLICY)
+        # Header injection guard: a subject never spans lines
+        message["Subject"] = " ".join(self.subject.render(values).split())
+        message.set_content(self.text.render(values))
+        message.add_alternative(self.html.render(values), subtype="html")
+        return message
+
+
+def load_template(name: str, directory: Path = TEMPLATE_DIR) -> EmailTemplate:
+    def read(suffix: str) -> str:
+        return (directory / f"{name}{suffix}").read_text(encoding="utf-8")
+
+    return EmailTemplate(
+        subject=CompiledTemplate(read(".subject.txt").strip()),
+        text=CompiledTemplate(read(".txt")),
+        html=CompiledTemplate(read(".html"), escape=_escape_html),
+    )
+
+
+def contact_context(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Template values for a contact submission."""
+    return {
+        "first_name": data["first_name"],
+        "last_name": data["last_name"],
+        "email": data["email"],
+        "phone_number": data["phone_number"],
+        "message": data["message"],
+        "services": ", ".join(data.get("services") or []) or "—",
+    }
+
+
+# Compiled at import, i.e. when the sender is first created during startup warm-up
+CONTACT_NOTIFICATION = load_template("contact_notification")
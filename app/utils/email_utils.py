@@ -1,20 +1,29 @@
 # app/utils/email_utils.py
-import os
+import asyncio
 from email.message import EmailMessage
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional
 from aiosmtplib import SMTP
-from dotenv import load_dotenv
 
-load_dotenv()
+from app.core.config import settings
+from app.utils.email_templates import CONTACT_NOTIFICATION, contact_context
+
+
+class SenderBusy(Exception):
+    """Nothing was sent: the session stayed busy, or the caller withdrew while waiting."""
+
 
 class EmailSender:
     def __init__(self):
-        self.smtp_host = os.getenv("SMTP_HOST", "smtp.gmail.com")
-        self.smtp_port = int(os.getenv("SMTP_PORT", 587))
-        self.smtp_user = os.getenv("SMTP_USERNAME")
-        self.smtp_pass = os.getenv("SMTP_PASSWORD")
-        self.notify_email = os.getenv("NOTIFY_EMAIL")
-        self.from_email = os.getenv("DEFAULT_FROM_EMAIL", self.smtp_user or "")
+        self.smtp_host = settings.smtp_host
+        self.smtp_port = settings.smtp_port
+        self.smtp_user = settings.smtp_username
+        self.smtp_pass = settings.smtp_password
+        self.use_tls = settings.smtp_use_tls
+        self.notify_email = settings.notify_email
+        self.from_email = settings.default_from_email or self.smtp_user
+        self.connect_timeout = settings.smtp_connect_timeout
+        self.send_timeout = settings.smtp_send_timeout
+        self.lock_timeout = settings.smtp_lock_timeout
 
         if not all([self.smtp_user, self.smtp_pass, self.notify_email]):
             raise EnvironmentError(
@@ -25,32 +34,78 @@ class EmailSender:
             hostname=self.smtp_host,
             port=self.smtp_port,
             start_tls=False,
+            timeout=self.connect_timeout,
         )
 
+        # One SMTP session carries one transaction at a time. Whoever holds this
+        # lock owns the connection: only the holder sends, times out or closes it.
+        self._lock = asyncio.Lock()
+
     async def connect(self):
         if not self.smtp_client.is_connected:
             await self.smtp_client.connect()
-            await self.smtp_client.starttls()
+            if self.use_tls:
+                await self.smtp_client.starttls()
             await self.smtp_client.login(self.smtp_user, self.smtp_pass)
 
-    async def send_contact_email(self, data: Dict[str, Any]) -> None:
-        await self.connect()
+    async def warm(self) -> None:
+        """Open the session ahead of the first send, under the same ownership rules."""
+        async with self._lock:
+            await self._owned(self.connect(), self.send_timeout)
+
+    async def close(self) -> None:
+        """Politely QUIT the SMTP session, or just drop the socket if that hangs."""
+        async with self._lock:
+            if not self.smtp_client.is_connected:
+                return
+            try:
+                await asyncio.wait_for(self.smtp_client.quit(), timeout=self.connect_timeout)
+            except Exception:
+                self.smtp_client.close()
+
+    async def send_contact_email(self, data: Dict[str, Any],
+                                 recipients: Optional[List[str]] = None,
+                                 proceed: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Mail ``data`` to ``recipients`` (default NOTIFY_EMAIL) in one SMTP transaction.
 
-        message = EmailMessage()
+        Waits at most ``lock_timeout`` for the session, then asks ``proceed``
+        whether the send is still wanted (e.g. the circuit opened meanwhile).
+        Either way out raises SenderBusy without touching the server.
+        """
+        recipients = recipients or [self.notify_email]
+        # Rendered once, outside the lock; every recipient is an RCPT TO on the same transaction
+        message = render_contact_message(data)
         message["From"] = self.from_email
-        message["To"] = self.notify_email
-        message["Subject"] = (
-            f"New Contact Form Submission from {data['first_name']} {data['last_name']}"
-        )
+        message["To"] = ", ".join(recipients)
+
+        # The send timeout starts once we own the connection, so waiting behind
+        # other sends under load is not mistaken for a dead server
+        try:
+            await asyncio.wait_for(self._lock.acquire(), timeout=self.lock_timeout)
+        except asyncio.TimeoutError:
+            raise SenderBusy("SMTP session busy")
+        try:
+            if proceed is not None and not proceed():
+                raise SenderBusy("Send withdrawn while waiting for the SMTP session")
+            await self._owned(self._send(message, recipients), self.send_timeout)
+        finally:
+            self._lock.release()
+
+    async def _owned(self, operation, timeout: float) -> None:
+        """Run an SMTP operation while holding the lock; on failure drop our own session."""
+        try:
+            await asyncio.wait_for(operation, timeout=timeout)
+        except BaseException:
+            # Drop a half-open connection so the next attempt starts clean
+            self.smtp_client.close()
+            raise
+
+    async def _send(self, message: EmailMessage, recipients: List[str]) -> None:
+        await self.connect()
+        await self.smtp_client.send_message(message, recipients=recipients)
 
-        body = (
-            "✅ You have a new contact form submission!\n\n"
-            f"📌 Full Name: {data['first_name']} {data['last_name']}\n"
-            f"📧 Email: {data['email']}\n"
-            f"📱 Phone: {data['phone_number']}\n"
-            "💬 Message:\n"
-            f"{data['message']}"
-        )
-        message.set_content(body)
 
-        await self.smtp_client.send_message(message)
+def render_contact_message(data: Dict[str, Any]) -> EmailMessage:
+    """The notification for one submission, without From/To so it can go to any recipients."""
+    return CONTACT_NOTIFICATION.render(contact_context(data))
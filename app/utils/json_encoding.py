@@ -0,0 +1,34 @@
+# app/utils/json_encoding.py
+import json
+from datetime import date, datetime
+from typing import Any
+
+from bson import ObjectId
+from starlette.responses import JSONResponse
+
+try:  # optional; ~5-10x faster than the stdlib encoder
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize Mongo documents (ObjectId, datetime) straight to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that skips FastAPI's jsonable_encoder pass and encodes raw documents."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,36 @@
+# app/utils/pagination.py
+import base64
+from datetime import datetime, timedelta
+from typing import Any, Dict, Tuple
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def encode_cursor(timestamp: datetime, doc_id: Any) -> str:
+    """Opaque cursor for the last row of a page sorted by (timestamp, _id) descending."""
+    millis = (timestamp - _EPOCH) // timedelta(milliseconds=1)
+    raw = f"{millis}|{doc_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor; raises ValueError for anything it did not produce."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        millis, doc_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|", 1)
+        return _EPOCH + timedelta(milliseconds=int(millis)), doc_id
+    except (ValueError, UnicodeDecodeError, OverflowError):
+        raise ValueError("Invalid cursor")
+
+
+def keyset_after(field: str, timestamp: datetime, doc_id: Any) -> Dict[str, Any]:
+    """
+    Filter for the rows after the cursor when sorting ``{field: -1, _id: -1}``.
+    Mongo stores milliseconds, so the round-tripped timestamp compares exactly.
+    """
+    return {
+        "$or": [
+            {field: {"$lt": timestamp}},
+            {field: timestamp, "_id": {"$lt": doc_id}},
+        ]
+    }
@@ -0,0 +1,104 @@
+# app/utils/rate_limit.py
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+
+class TokenBucket:
+    """A single token bucket refilled at ``rate`` tokens/second up to ``burst``."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated_at")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+
+    def acquire(self, now: Optional[float] = None) -> float:
+        """Take one token. Returns 0 on success, else seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class KeyedRateLimiter:
+    """
+    Token buckets per key (e.g. client IP).
+
+    State is a plain ``[tokens, updated_at]`` list per key, spread over a few
+    dicts so eviction only walks one shard at a time. Idle buckets that would
+    be full again anyway are dropped every ``evict_interval`` seconds, one
+    shard per interval, so memory stays bounded during a spray of new IPs.
+    """
+
+    def __init__(self, rate: float, burst: float, shards: int = 16,
+                 evict_interval: float = 30.0):
+        self.rate = rate
+        self.burst = burst
+        self._shards: List[Dict[str, list]] = [{} for _ in range(shards)]
+        self._evict_interval = evict_interval / shards
+        self._next_evict_at = time.monotonic() + self._evict_interval
+        self._evict_cursor = 0
+        # After this long a bucket has refilled completely, so forgetting it is lossless
+        self._idle_after = burst / rate
+
+    def acquire(self, key: str) -> float:
+        """Take one token for ``key``. Returns 0 on success, else seconds to wait."""
+        now = time.monotonic()
+        if now >= self._next_evict_at:
+            self._evict_shard(now)
+
+        shard = self._shards[hash(key) % len(self._shards)]
+        state = shard.get(key)
+        if state is None:
+            shard[key] = [self.burst - 1, now]
+            return 0.0
+
+        tokens = min(self.burst, state[0] + (now - state[1]) * self.rate)
+        state[1] = now
+        if tokens >= 1:
+            state[0] = tokens - 1
+            return 0.0
+        state[0] = tokens
+        return (1 - tokens) / self.rate
+
+    def _evict_shard(self, now: float) -> None:
+        shard = self._shards[self._evict_cursor]
+        cutoff = now - self._idle_after
+        for key in [k for k, state in shard.items() if state[1] < cutoff]:
+            del shard[key]
+        self._evict_cursor = (self._evict_cursor + 1) % len(self._shards)
+        self._next_evict_at = now + self._evict_interval
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+class AdmissionController:
+    """
+    Caps the number of in-flight operations. Callers that can't get a slot
+    should be shed immediately rather than queued behind a slow backend.
+    """
+
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+    def try_enter(self) -> bool:
+        if self.in_flight >= self.max_in_flight:
+            return False
+        self.in_flight += 1
+        return True
+
+    def leave(self) -> None:
+        self.in_flight -= 1
+
+    async def wait_idle(self, poll_interval: float = 0.05) -> None:
+        """Return once nothing is in flight (used while shutting down)."""
+        while self.in_flight > 0:
+            await asyncio.sleep(poll_interval)
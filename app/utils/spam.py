@@ -0,0 +1,87 @@
+# app/utils/spam.py
+"""
+CPU-side spam scoring. Everything here runs inside the spam process pool, so
+it only imports the standard library and keeps no state beyond the model.
+"""
+import pickle
+import re
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+_URL = re.compile(r"(?:https?://|www\.)\S+|\b[\w-]+\.(?:com|net|org|ru|cn|xyz|top|info|biz)/\S*",
+                  re.IGNORECASE)
+_WORD = re.compile(r"\w+")
+
+# Throwaway inbox providers; SPAM_DISPOSABLE_DOMAINS adds to this list
+DISPOSABLE_DOMAINS: FrozenSet[str] = frozenset({
+    "10minutemail.com", "guerrillamail.com", "guerrillamail.net", "mailinator.com",
+    "maildrop.cc", "sharklasers.com", "temp-mail.org", "tempmail.com", "throwawaymail.com",
+    "trashmail.com", "yopmail.com", "getnada.com", "dispostable.com", "fakeinbox.com",
+})
+
+Check = Callable[[Dict[str, Any]], Optional[Tuple[float, str]]]
+
+_model: Any = None
+
+
+def check_links(submission: Dict[str, Any]) -> Optional[Tuple[float, str]]:
+    message = submission.get("message") or ""
+    links = len(_URL.findall(message))
+    if not links:
+        return None
+    words = max(len(_WORD.findall(message)), 1)
+    if links >= 3 or links / words > 0.2:
+        return 0.6, "links"
+    return 0.2, "link"
+
+
+def check_disposable_domain(submission: Dict[str, Any]) -> Optional[Tuple[float, str]]:
+    domain = (submission.get("email_normalized") or "").rpartition("@")[2]
+    if domain in DISPOSABLE_DOMAINS or domain in submission.get("_disposable_domains", ()):
+        return 0.4, "disposable_domain"
+    return None
+
+
+def check_repetition(submission: Dict[str, Any]) -> Optional[Tuple[float, str]]:
+    words = [w.lower() for w in _WORD.findall(submission.get("message") or "")]
+    if len(words) >= 10 and len(set(words)) / len(words) < 0.3:
+        return 0.3, "repetitive"
+    return None
+
+
+def check_model(submission: Dict[str, Any]) -> Optional[Tuple[float, str]]:
+    if _model is None:
+        return None
+    text = f"{submission.get('first_name', '')} {submission.get('message', '')}"
+    probability = float(_model.predict_proba([text])[0][1])
+    return (probability, "model") if probability >= 0.5 else None
+
+
+# Add new checks here; scores are summed and capped at 1.0
+CHECKS: List[Check] = [check_links, check_disposable_domain, check_repetition, check_model]
+
+
+def load_model(path: str) -> None:
+    """
+    Process-pool initializer: load the optional classifier once per worker.
+    Any pickled object with a scikit-learn style ``predict_proba([text])``
+    works; a missing or broken file just disables the model check.
+    """
+    global _model
+    if not path:
+        return
+    try:
+        with open(path, "rb") as f:
+            _model = pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ Spam model not loaded from {path}: {e}")
+
+
+def score(submission: Dict[str, Any]) -> Tuple[float, List[str]]:
+    total = 0.0
+    reasons: List[str] = []
+    for check in CHECKS:
+        hit = check(submission)
+        if hit is not None:
+            total += hit[0]
+            reasons.append(hit[1])
+    return min(total, 1.0), reasons
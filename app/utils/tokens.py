@@ -0,0 +1,77 @@
+# app/utils/tokens.py
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, Iterable, List
+
+
+class TokenError(Exception):
+    """Raised for malformed, forged or expired tokens."""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+_HEADER = _b64encode(b'{"alg":"HS256","typ":"JWT"}')
+
+
+class HS256Signer:
+    """
+    Minimal HS256 JWT encoder/verifier.
+
+    The HMAC state for each key is built once and copied per token, so
+    verification is a hash over the token and nothing else. The first key
+    signs; all keys verify, which allows rotating the secret without logging
+    everyone out.
+    """
+
+    def __init__(self, keys: Iterable[bytes]):
+        self._macs: List[hmac.HMAC] = [hmac.new(key, digestmod=hashlib.sha256) for key in keys]
+        if not self._macs:
+            raise ValueError("At least one signing key is required")
+
+    def _sign(self, mac: hmac.HMAC, signing_input: bytes) -> bytes:
+        mac = mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        signing_input = f"{_HEADER}.{payload}".encode("ascii")
+        return f"{_HEADER}.{payload}.{_b64encode(self._sign(self._macs[0], signing_input))}"
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        if not token.isascii():  # headers arrive latin-1 decoded; ours are pure base64url
+            raise TokenError("Malformed token")
+        try:
+            header, payload, signature = token.split(".")
+        except ValueError:
+            raise TokenError("Malformed token")
+        if header != _HEADER:  # only our exact header; rejects alg=none and friends
+            raise TokenError("Unsupported token header")
+        try:
+            signature_bytes = _b64decode(signature)
+        except ValueError:
+            raise TokenError("Malformed token")
+
+        signing_input = f"{header}.{payload}".encode("ascii")
+        if not any(hmac.compare_digest(self._sign(mac, signing_input), signature_bytes)
+                   for mac in self._macs):
+            raise TokenError("Invalid token signature")
+
+        try:
+            claims = json.loads(_b64decode(payload))
+        except ValueError:
+            raise TokenError("Malformed token")
+        if not isinstance(claims, dict):
+            raise TokenError("Malformed token")
+        if claims.get("exp", 0) < time.time():
+            raise TokenError("Token expired")
+        return claims
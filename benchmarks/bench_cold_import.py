@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Cold-import benchmark for the API.
+
+Imports ``app.main`` in a fresh interpreter several times, with SMTP settings
+removed from the environment, and reports how long the import takes. Also
+proves the app can be imported without any mail configuration (unless a
+local .env supplies it).
+
+    python -m benchmarks.bench_cold_import
+    python -m benchmarks.bench_cold_import --runs 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+_SMTP_VARS = (
+    "SMTP_HOST", "SMTP_PORT", "SMTP_USERNAME", "SMTP_PASSWORD",
+    "NOTIFY_EMAIL", "DEFAULT_FROM_EMAIL",
+)
+
+_IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def measure_import(env: dict) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SNIPPET],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold import time of app.main")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    env = {k: v for k, v in os.environ.items()
+           if k.upper() not in _SMTP_VARS}
+    env["PYTHONPATH"] = os.getcwd()
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+
+    timings = [measure_import(env) * 1000 for _ in range(args.runs)]
+    print(f"import app.main (no SMTP configured), {args.runs} runs:")
+    print(f"  min    {min(timings):8.1f} ms")
+    print(f"  median {statistics.median(timings):8.1f} ms")
+    print(f"  max    {max(timings):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
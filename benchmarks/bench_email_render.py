@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the notification email templates.
+
+Compares the precompiled templates with ``string.Template.substitute`` on
+the same sources, then times building (and serialising) the full multipart
+message, which is what each submission pays.
+
+    python -m benchmarks.bench_email_render
+    python -m benchmarks.bench_email_render --iterations 50000
+"""
+import argparse
+import time
+from string import Template
+
+from app.utils.email_templates import (
+    CONTACT_NOTIFICATION, TEMPLATE_DIR, _escape_html, contact_context,
+)
+
+SAMPLE_CONTACT = {
+    "first_name": "John",
+    "last_name": "Smith",
+    "email": "john.smith@example.com",
+    "phone_number": "+1234567890",
+    "message": "Interested in web development services for my startup.\nCan we talk next week?",
+    "services": ["Web Development", "SEO"],
+}
+
+
+def _timed(label: str, iterations: int, fn) -> None:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {iterations / elapsed:>12,.0f}/s  ({elapsed / iterations * 1e6:.1f} µs each)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Email template render throughput")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    values = contact_context(SAMPLE_CONTACT)
+    html_values = {name: _escape_html(str(value)) for name, value in values.items()}
+    naive_html = Template((TEMPLATE_DIR / "contact_notification.html").read_text(encoding="utf-8"))
+    naive_text = Template((TEMPLATE_DIR / "contact_notification.txt").read_text(encoding="utf-8"))
+
+    _timed("html: string.Template.substitute", args.iterations,
+           lambda: naive_html.substitute(html_values))
+    _timed("html: precompiled", args.iterations,
+           lambda: CONTACT_NOTIFICATION.html.render(values))
+    _timed("text: string.Template.substitute", args.iterations,
+           lambda: naive_text.substitute(values))
+    _timed("text: precompiled", args.iterations,
+           lambda: CONTACT_NOTIFICATION.text.render(values))
+
+    message_iterations = max(args.iterations // 10, 1)
+    _timed("multipart message", message_iterations,
+           lambda: CONTACT_NOTIFICATION.render(values))
+    _timed("multipart message + serialise", message_iterations,
+           lambda: CONTACT_NOTIFICATION.render(values).as_bytes())
+
+
+if __name__ == "__main__":
+    main()
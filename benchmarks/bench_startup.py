@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Cold-start profile for ``app.main:app`` with a regression budget.
+
+1. Runs ``python -X importtime -c "import app.main"`` and prints the modules
+   with the largest cumulative import time.
+2. Starts uvicorn in a fresh process and measures the time until the first
+   request is answered (MongoDB must be reachable for startup to finish).
+
+Exits non-zero when either number exceeds its budget, so CI can fail on
+cold-start regressions:
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --import-budget-ms 800 --ready-budget-ms 3000
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+READY_PATH = "/healthz"
+
+
+def profile_imports(top: int) -> float:
+    """Print the slowest imports; return the total import time of app.main in ms."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+
+    total_ms = next((c for c, _, n in rows if n == "app.main"), 0) / 1000
+    print(f"Slowest imports (cumulative) for app.main — total {total_ms:.1f} ms:")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {name}")
+    return total_ms
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(timeout: float) -> float:
+    """Start uvicorn and return ms until READY_PATH answers 200."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}{READY_PATH}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited during startup:\n{server.stderr.read()}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise RuntimeError(f"server not ready after {timeout:.0f}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start profile with budget")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--import-budget-ms", type=float,
+                        default=float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "1000")))
+    parser.add_argument("--ready-budget-ms", type=float,
+                        default=float(os.getenv("STARTUP_READY_BUDGET_MS", "4000")))
+    parser.add_argument("--skip-server", action="store_true",
+                        help="only profile imports (no MongoDB needed)")
+    args = parser.parse_args()
+
+    failures = []
+    import_ms = profile_imports(args.top)
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import {import_ms:.0f} ms > budget {args.import_budget_ms:.0f} ms")
+
+    if not args.skip_server:
+        try:
+            ready_ms = time_to_first_request(timeout=max(30.0, args.ready_budget_ms / 1000 * 3))
+        except RuntimeError as exc:
+            print(f"\n❌ Could not measure time to first request: {exc}")
+            sys.exit(2)
+        print(f"\nTime to first ready request ({READY_PATH}): {ready_ms:.0f} ms")
+        if ready_ms > args.ready_budget_ms:
+            failures.append(f"ready {ready_ms:.0f} ms > budget {args.ready_budget_ms:.0f} ms")
+
+    if failures:
+        print("\n❌ Startup budget exceeded: " + "; ".join(failures))
+        sys.exit(1)
+    print("\n✅ Startup within budget")
+
+
+if __name__ == "__main__":
+    main()
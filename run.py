@@ -1,14 +1,70 @@
-import uvicorn
-from dotenv import load_dotenv
+import argparse
+import importlib.util
+import inspect
 import os
+import sys
+
+import uvicorn
 
-# Load environment variables from .env file
-load_dotenv()
+from app.core.config import settings  # loads .env once
 
-if __name__ == "__main__":
+
+def _has(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the COSMO Digitals API")
+    parser.add_argument("--prod", action="store_true", default=settings.app_env == "production",
+                        help="multi-worker production mode (default when APP_ENV=production)")
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, default=settings.server_port)
+    parser.add_argument("--workers", type=int, default=settings.web_concurrency,
+                        help="worker processes in --prod mode (default: one per CPU)")
+    return parser.parse_args()
+
+
+def run_dev(args):
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
+        host=args.host,
+        port=args.port,
         reload=True
     )
+
+
+def run_prod(args):
+    workers = args.workers or os.cpu_count() or 1
+    if not settings.jwt_secret:
+        # Every worker would sign tokens with its own random key
+        sys.exit("JWT_SECRET must be set to run in production mode")
+    options = dict(
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        # Each worker is a fresh process that imports the app and opens its own
+        # Motor client in the lifespan, so no connection pool is shared across fork.
+        loop="uvloop" if _has("uvloop") else "auto",
+        http="httptools" if _has("httptools") else "auto",
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keep_alive,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        # Recycle workers periodically to cap slow memory growth
+        limit_max_requests=settings.server_max_requests or None,
+        proxy_headers=settings.trust_forwarded_for,
+        access_log=False,
+    )
+    # Stagger recycling so workers don't all restart at once (newer uvicorn only)
+    if "limit_max_requests_jitter" in inspect.signature(uvicorn.Config).parameters:
+        options["limit_max_requests_jitter"] = settings.server_max_requests_jitter
+    print(f"🚀 Starting {workers} worker(s) on {args.host}:{args.port} "
+          f"(loop={options['loop']}, http={options['http']})")
+    uvicorn.run("app.main:app", **options)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.prod:
+        run_prod(args)
+    else:
+        run_dev(args)
@@ -3,9 +3,11 @@
 Comprehensive test script for the COSMO Digitals Admin API
 Tests all endpoints and validates responses
 """
+import os
 import requests
 import json
 import sys
+import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -14,6 +16,7 @@ class AdminAPITester:
         self.base_url = base_url
         self.api_url = f"{base_url}/api/v1"
         self.test_results = []
+        self.headers = {}
         
     def log_test(self, test_name: str, success: bool, message: str, data: Any = None):
         """Log test results"""
@@ -34,7 +37,7 @@ class AdminAPITester:
     def test_health_check(self) -> bool:
         """Test if the API server is running"""
         try:
-            response = requests.get(f"{self.base_url}/docs", timeout=5)
+            response = requests.get(f"{self.base_url}/healthz", timeout=5)
             success = response.status_code == 200
             self.log_test("Health Check", success, f"Server status: {response.status_code}")
             return success
@@ -42,6 +45,24 @@ class AdminAPITester:
             self.log_test("Health Check", False, f"Server not reachable: {str(e)}")
             return False
     
+    def test_admin_login(self) -> bool:
+        """Log in as admin; the dashboard endpoints require a Bearer token"""
+        credentials = {
+            "email": os.getenv("ADMIN_EMAIL", "admin@cosmodigitals.com"),
+            "password": os.getenv("ADMIN_PASSWORD", ""),
+        }
+        try:
+            response = requests.post(f"{self.api_url}/auth/login", json=credentials, timeout=10)
+            if response.status_code == 200:
+                self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+                self.log_test("Admin Login", True, "Access token issued")
+                return True
+            self.log_test("Admin Login", False, f"Status {response.status_code}: {response.text}")
+            return False
+        except Exception as e:
+            self.log_test("Admin Login", False, f"Request failed: {str(e)}")
+            return False
+    
     def test_cors_headers(self) -> bool:
         """Test CORS headers for frontend integration"""
         try:
@@ -88,7 +109,7 @@ class AdminAPITester:
     def test_get_contacts(self) -> list:
         """Test retrieving all contacts"""
         try:
-            response = requests.get(f"{self.api_url}/contact", timeout=10)
+            response = requests.get(f"{self.api_url}/contact", headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 contacts = response.json()
@@ -129,7 +150,7 @@ class AdminAPITester:
         }
         
         try:
-            response = requests.put(f"{self.api_url}/contact/{contact_id}", json=update_data, timeout=10)
+            response = requests.put(f"{self.api_url}/contact/{contact_id}", json=update_data, headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 self.log_test("Update Contact", True, "Contact updated successfully")
@@ -148,7 +169,7 @@ class AdminAPITester:
             return False
         
         try:
-            response = requests.delete(f"{self.api_url}/contact/{contact_id}", timeout=10)
+            response = requests.delete(f"{self.api_url}/contact/{contact_id}", headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 self.log_test("Delete Contact", True, "Contact deleted successfully")
@@ -160,6 +181,97 @@ class AdminAPITester:
             self.log_test("Delete Contact", False, f"Request failed: {str(e)}")
             return False
     
+    def _unique_contact(self) -> Dict[str, Any]:
+        """A submission no earlier run has sent, so duplicate detection stays out of the way"""
+        return {
+            "first_name": "Admin",
+            "last_name": "TestUser",
+            "email": "admin.test@cosmodigitals.com",
+            "phone_number": "+1234567890",
+            "message": f"Admin API test submission {uuid.uuid4()}",
+            "services": ["SEO"]
+        }
+    
+    def test_conditional_get(self, contact_id: str) -> bool:
+        """Test that GET /contact/{id} answers 304 when If-None-Match matches its ETag"""
+        try:
+            url = f"{self.api_url}/contact/{contact_id}"
+            first = requests.get(url, headers=self.headers, timeout=10)
+            etag = first.headers.get("ETag")
+            if first.status_code != 200 or not etag:
+                self.log_test("Conditional GET", False, f"Status {first.status_code}, ETag {etag!r}")
+                return False
+            response = requests.get(url, headers={**self.headers, "If-None-Match": etag}, timeout=10)
+            success = response.status_code == 304
+            self.log_test("Conditional GET", success, f"If-None-Match {etag} -> status {response.status_code}")
+            return success
+        except Exception as e:
+            self.log_test("Conditional GET", False, f"Request failed: {str(e)}")
+            return False
+    
+    def test_patch_if_match(self, contact_id: str) -> bool:
+        """Test PATCH with If-Match: the current ETag succeeds, the now-stale one gets 412"""
+        try:
+            url = f"{self.api_url}/contact/{contact_id}"
+            etag = requests.get(url, headers=self.headers, timeout=10).headers.get("ETag")
+            response = requests.patch(url, json={"first_name": "Patched"},
+                                      headers={**self.headers, "If-Match": etag}, timeout=10)
+            success = response.status_code == 200 and response.headers.get("ETag") != etag
+            self.log_test("PATCH If-Match", success, f"Status {response.status_code}", response.text)
+            
+            stale = requests.patch(url, json={"first_name": "Stale"},
+                                   headers={**self.headers, "If-Match": etag}, timeout=10)
+            stale_ok = stale.status_code == 412
+            self.log_test("PATCH Stale If-Match", stale_ok, f"Status {stale.status_code}", stale.text)
+            return success and stale_ok
+        except Exception as e:
+            self.log_test("PATCH If-Match", False, f"Request failed: {str(e)}")
+            return False
+    
+    def test_idempotency_key(self) -> Optional[str]:
+        """Test Idempotency-Key: a retry replays the first response, another body is rejected"""
+        contact = self._unique_contact()
+        headers = {"Idempotency-Key": str(uuid.uuid4())}
+        try:
+            first = requests.post(f"{self.api_url}/contact", json=contact, headers=headers, timeout=10)
+            retry = requests.post(f"{self.api_url}/contact", json=contact, headers=headers, timeout=10)
+            success = (
+                first.status_code == 201
+                and retry.status_code == first.status_code
+                and retry.headers.get("Idempotent-Replayed") == "true"
+                and retry.json() == first.json()
+            )
+            self.log_test("Idempotency Replay", success,
+                          f"Statuses {first.status_code}/{retry.status_code}", retry.text)
+            
+            other = {**contact, "message": contact["message"] + " (edited)"}
+            reused = requests.post(f"{self.api_url}/contact", json=other, headers=headers, timeout=10)
+            reused_ok = reused.status_code == 422
+            self.log_test("Idempotency Key Reuse", reused_ok, f"Status {reused.status_code}", reused.text)
+            return first.json().get("id") if success else None
+        except Exception as e:
+            self.log_test("Idempotency Replay", False, f"Request failed: {str(e)}")
+            return None
+    
+    def test_duplicate_submission(self) -> Optional[str]:
+        """Test that re-sending the same submission returns 200 with the original id"""
+        contact = self._unique_contact()
+        try:
+            first = requests.post(f"{self.api_url}/contact", json=contact, timeout=10)
+            again = requests.post(f"{self.api_url}/contact", json=contact, timeout=10)
+            original_id = first.json().get("id")
+            success = (
+                first.status_code == 201
+                and again.status_code == 200
+                and again.json().get("id") == original_id
+            )
+            self.log_test("Duplicate Submission", success,
+                          f"Statuses {first.status_code}/{again.status_code}", again.text)
+            return original_id
+        except Exception as e:
+            self.log_test("Duplicate Submission", False, f"Request failed: {str(e)}")
+            return None
+    
     def test_invalid_contact_creation(self) -> bool:
         """Test contact creation with invalid data"""
         invalid_contacts = [
@@ -222,16 +334,28 @@ class AdminAPITester:
         # Test CORS
         self.test_cors_headers()
         
+        # Admin endpoints need a token
+        if not self.test_admin_login():
+            print("❌ Admin login failed. Set ADMIN_EMAIL and ADMIN_PASSWORD to match the server.")
+            return False
+        
         # Test contact operations
         contact_id = self.test_create_contact()
         self.test_get_contacts()
         
         if contact_id:
+            self.test_conditional_get(contact_id)
+            self.test_patch_if_match(contact_id)
             self.test_update_contact(contact_id)
             self.test_get_contacts()  # Verify update
             self.test_delete_contact(contact_id)
             self.test_get_contacts()  # Verify deletion
         
+        # Retries and re-submissions
+        for extra_id in (self.test_idempotency_key(), self.test_duplicate_submission()):
+            if extra_id:
+                self.test_delete_contact(extra_id)
+        
         # Test invalid data handling
         self.test_invalid_contact_creation()
         
@@ -3,6 +3,7 @@
 Comprehensive test script for the COSMO Digitals Admin Dashboard
 Tests dashboard-specific functionality and frontend-backend integration
 """
+import os
 import requests
 import json
 import sys
@@ -14,6 +15,7 @@ class AdminDashboardTester:
         self.base_url = base_url
         self.api_url = f"{base_url}/api/v1"
         self.test_results = []
+        self.headers = {}
         self.test_contacts = []
         
     def log_test(self, test_name: str, success: bool, message: str, data: Any = None):
@@ -32,6 +34,24 @@ class AdminDashboardTester:
         if data and not success:
             print(f"   Details: {data}")
     
+    def test_admin_login(self) -> bool:
+        """Log in as admin; the dashboard endpoints require a Bearer token"""
+        credentials = {
+            "email": os.getenv("ADMIN_EMAIL", "admin@cosmodigitals.com"),
+            "password": os.getenv("ADMIN_PASSWORD", ""),
+        }
+        try:
+            response = requests.post(f"{self.api_url}/auth/login", json=credentials, timeout=10)
+            if response.status_code == 200:
+                self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+                self.log_test("Admin Login", True, "Access token issued")
+                return True
+            self.log_test("Admin Login", False, f"Status {response.status_code}: {response.text}")
+            return False
+        except Exception as e:
+            self.log_test("Admin Login", False, f"Request failed: {str(e)}")
+            return False
+    
     def setup_test_data(self) -> bool:
         """Create test contacts for dashboard testing"""
         test_contacts_data = [
@@ -82,7 +102,7 @@ class AdminDashboardTester:
     def test_dashboard_data_retrieval(self) -> bool:
         """Test that dashboard can retrieve and display contact data"""
         try:
-            response = requests.get(f"{self.api_url}/contact", timeout=10)
+            response = requests.get(f"{self.api_url}/contact", headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 contacts = response.json()
@@ -115,7 +135,7 @@ class AdminDashboardTester:
     def test_dashboard_sorting(self) -> bool:
         """Test that contacts are sorted by creation date (newest first)"""
         try:
-            response = requests.get(f"{self.api_url}/contact", timeout=10)
+            response = requests.get(f"{self.api_url}/contact", headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 contacts = response.json()
@@ -154,7 +174,7 @@ class AdminDashboardTester:
     def test_dashboard_search_functionality(self) -> bool:
         """Test dashboard search by retrieving contacts and checking data integrity"""
         try:
-            response = requests.get(f"{self.api_url}/contact", timeout=10)
+            response = requests.get(f"{self.api_url}/contact", headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 contacts = response.json()
@@ -202,16 +222,15 @@ class AdminDashboardTester:
         }
         
         try:
-            response = requests.put(f"{self.api_url}/contact/{contact_id}", json=update_data, timeout=10)
+            response = requests.put(f"{self.api_url}/contact/{contact_id}", json=update_data, headers=self.headers, timeout=10)
             
             if response.status_code == 200:
                 self.log_test("Dashboard Contact Update", True, "Contact updated successfully")
                 
                 # Verify the update
-                get_response = requests.get(f"{self.api_url}/contact", timeout=10)
+                get_response = requests.get(f"{self.api_url}/contact/{contact_id}", headers=self.headers, timeout=10)
                 if get_response.status_code == 200:
-                    contacts = get_response.json()
-                    updated_contact = next((c for c in contacts if c.get("id") == contact_id), None)
+                    updated_contact = get_response.json()
                     
                     if updated_contact and updated_contact.get("first_name") == "John Updated":
                         self.log_test("Dashboard Contact Verification", True, "Update verified successfully")
@@ -236,7 +255,7 @@ class AdminDashboardTester:
             
             # Make multiple requests to simulate dashboard usage
             for i in range(5):
-                response = requests.get(f"{self.api_url}/contact", timeout=10)
+                response = requests.get(f"{self.api_url}/contact", headers=self.headers, timeout=10)
                 if response.status_code != 200:
                     self.log_test("Dashboard Performance", False, f"Request {i+1} failed: {response.status_code}")
                     return False
@@ -276,11 +295,11 @@ class AdminDashboardTester:
         for test in invalid_tests:
             try:
                 if test["method"] == "GET":
-                    response = requests.get(test["url"], timeout=10)
+                    response = requests.get(test["url"], headers=self.headers, timeout=10)
                 elif test["method"] == "PUT":
-                    response = requests.put(test["url"], json={}, timeout=10)
+                    response = requests.put(test["url"], json={}, headers=self.headers, timeout=10)
                 elif test["method"] == "DELETE":
-                    response = requests.delete(test["url"], timeout=10)
+                    response = requests.delete(test["url"], headers=self.headers, timeout=10)
                 
                 success = response.status_code == test["expected_status"]
                 self.log_test(f"Error Handling - {test['name']}", success, f"Status {response.status_code}")
@@ -300,7 +319,7 @@ class AdminDashboardTester:
         deleted_count = 0
         for contact_id in self.test_contacts:
             try:
-                response = requests.delete(f"{self.api_url}/contact/{contact_id}", timeout=10)
+                response = requests.delete(f"{self.api_url}/contact/{contact_id}", headers=self.headers, timeout=10)
                 if response.status_code == 200:
                     deleted_count += 1
             except Exception:
@@ -316,6 +335,11 @@ class AdminDashboardTester:
         print(f"📍 Testing Dashboard at: {self.api_url}")
         print()
         
+        # Admin endpoints need a token
+        if not self.test_admin_login():
+            print("❌ Admin login failed. Set ADMIN_EMAIL and ADMIN_PASSWORD to match the server.")
+            return False
+        
         # Setup test data
         if not self.setup_test_data():
             print("❌ Failed to setup test data. Aborting tests.")
@@ -2,11 +2,26 @@
 """
 Test script for the Contact API endpoints
 """
+import os
 import requests
 import json
 from datetime import datetime
 
 BASE_URL = "http://localhost:8000/api/v1"
+HEADERS = {}
+
+def login():
+    """Log in as admin; listing, updating and deleting contacts require a Bearer token"""
+    credentials = {
+        "email": os.getenv("ADMIN_EMAIL", "admin@cosmodigitals.com"),
+        "password": os.getenv("ADMIN_PASSWORD", ""),
+    }
+    response = requests.post(f"{BASE_URL}/auth/login", json=credentials)
+    print(f"Admin Login Response: {response.status_code}")
+    if response.status_code == 200:
+        HEADERS["Authorization"] = f"Bearer {response.json()['access_token']}"
+    else:
+        print(f"Error: {response.text}")
 
 def test_create_contact():
     """Test creating a new contact"""
@@ -30,7 +45,7 @@ def test_create_contact():
 
 def test_get_contacts():
     """Test getting all contacts"""
-    response = requests.get(f"{BASE_URL}/contact")
+    response = requests.get(f"{BASE_URL}/contact", headers=HEADERS)
     print(f"Get Contacts Response: {response.status_code}")
     if response.status_code == 200:
         contacts = response.json()
@@ -57,7 +72,7 @@ def test_update_contact(contact_id):
         "services": ["Web Development", "SEO"]
     }
     
-    response = requests.put(f"{BASE_URL}/contact/{contact_id}", json=update_data)
+    response = requests.put(f"{BASE_URL}/contact/{contact_id}", json=update_data, headers=HEADERS)
     print(f"Update Contact Response: {response.status_code}")
     if response.status_code == 200:
         print(f"Contact updated: {response.json()}")
@@ -70,7 +85,7 @@ def test_delete_contact(contact_id):
         print("No contact ID provided for delete test")
         return
     
-    response = requests.delete(f"{BASE_URL}/contact/{contact_id}")
+    response = requests.delete(f"{BASE_URL}/contact/{contact_id}", headers=HEADERS)
     print(f"Delete Contact Response: {response.status_code}")
     if response.status_code == 200:
         print(f"Contact deleted: {response.json()}")
@@ -82,6 +97,10 @@ if __name__ == "__main__":
     print(f"Testing API at: {BASE_URL}")
     print()
     
+    # Admin endpoints need a token
+    login()
+    print()
+    
     # Test creating a contact
     print("1. Testing contact creation...")
     contact_id = test_create_contact()